@@ -13,15 +13,24 @@
 """Apply compression/decompression to data."""
 
 # standard libs
+import io
 import sys
 import argparse
-import platform
+import itertools
+from collections import deque
+from typing import List, Generator, Any
 
 # internal libs
 from ..io.stream import BinaryStream
-from ..io.compression import compress, decompress
+from ..io.pipeline import Prefetch, prefetch
+from ..io.compression import compress, decompress, CODECS, DEFAULT_CODEC, _isal_level
 
-if platform.system() == 'Windows':
+try:
+    from isal import igzip_threaded  # block-parallel gzip writer
+except ImportError:
+    igzip_threaded = None
+
+if sys.platform.startswith('win'):
     # FIXME: how do we ignore broken pipes on windows?
     pass
 else:
@@ -29,39 +38,92 @@ else:
     signal(SIGPIPE, SIG_DFL)
 
 
-parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
-
-parser.add_argument('sources', metavar='FILE', default=[], nargs='?',
-                    help='path to file')
+# reads smaller than this starve the (de)compressor and multiply calls across the boundary
+MIN_BUFFERSIZE = 0.25  # MB
 
-parser.add_argument('-b', '--buffersize', type=float, default=1.0,
-                    help='buffer size (in MB)')
-parser.add_argument('--encoding', type=str, default=None,
-                    help='specification (e.g., "utf-8")')
-parser.add_argument('-l', '--level', type=int, default=6,
-                    help='compression level to use')
+# batch compressor output before writing to stdout
+WRITE_BUFFERSIZE = 256 * 1024
 
-action_group = parser.add_mutually_exclusive_group()
-action_group.add_argument('-z', '--compress', action='store_true',
-                          help='compress data')
-action_group.add_argument('-d', '--decompress', action='store_true',
-                          help='decompress data')
+# buffers held ahead by the reader (and per file when decompressing with workers)
+PREFETCH_DEPTH = 2
 
 SCHEMES = 'gzip', 'bzip', 'lzma'
-spec_group = parser.add_mutually_exclusive_group()
-spec_group.add_argument('--gzip', action='store_true',
-                        help='use gzip/zlib compression algorithm')
-spec_group.add_argument('--bzip', action='store_true',
-                        help='use bzip2 compression algorithm')
-spec_group.add_argument('--lzma', action='store_true',
-                        help='use lzma compression algorithm')
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Command-line interface (built on demand, not at import)."""
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
+
+    parser.add_argument('sources', metavar='FILE', default=[], nargs='*',
+                        help='paths to files')
+
+    parser.add_argument('-b', '--buffersize', type=float, default=1.0,
+                        help='size of reads from input (in MB, minimum 0.25)')
+    # NOTE: kept for compatibility, data is always read and written as raw bytes
+    parser.add_argument('--encoding', type=str, default=None, help=argparse.SUPPRESS)
+    parser.add_argument('-l', '--level', type=int, default=6,
+                        help='compression level to use')
+
+    action_group = parser.add_mutually_exclusive_group()
+    action_group.add_argument('-z', '--compress', action='store_true',
+                              help='compress data')
+    action_group.add_argument('-d', '--decompress', action='store_true',
+                              help='decompress data')
+
+    spec_group = parser.add_mutually_exclusive_group()
+    spec_group.add_argument('--gzip', action='store_true',
+                            help='use gzip/zlib compression algorithm')
+    spec_group.add_argument('--bzip', action='store_true',
+                            help='use bzip2 compression algorithm')
+    spec_group.add_argument('--lzma', action='store_true',
+                            help='use lzma compression algorithm')
+
+    parser.add_argument('--codec', choices=list(CODECS.keys()), default=DEFAULT_CODEC,
+                        help=f'implementation of gzip/zlib to use (default: {DEFAULT_CODEC})')
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help='number of threads (gzip compression with isal, or decompression of many files)')
+    return parser
+
+
+def _iterfile(source: str, buffersize: int, **options: Any) -> Generator[None, bytes, None]:
+    """Decompress a single `source` file."""
+    with BinaryStream(source) as stream:
+        yield from decompress(stream.iterbuffers(buffersize), **options)
+
+
+def _decompress_many(sources: List[str], buffersize: int, workers: int,
+                     **options: Any) -> Generator[None, bytes, None]:
+    """
+    Decompress each of `sources` independently, up to `workers` at a time on
+    background threads. Output is yielded in the same order as `sources`.
+    """
+    sources = iter(sources)
+    pending = deque(Prefetch(_iterfile(source, buffersize, **options), depth=PREFETCH_DEPTH)
+                    for source in itertools.islice(sources, workers))
+    try:
+        while pending:
+            current = pending.popleft()
+            yield from current
+            source = next(sources, None)
+            if source is not None:
+                pending.append(Prefetch(_iterfile(source, buffersize, **options), depth=PREFETCH_DEPTH))
+    finally:
+        for worker in pending:
+            worker.close()
 
 
 def main() -> int:
     """Entry point for 'compress'."""
 
+    writer = None
+
     try:
-        argv = parser.parse_args()
+        argv = _build_parser().parse_args()
+        if argv.buffersize < MIN_BUFFERSIZE:
+            from ..core.logging import log  # NOTE: only import external libs when needed
+            log.warning(f'buffersize={argv.buffersize} MB is too small, using {MIN_BUFFERSIZE} MB')
+            argv.buffersize = MIN_BUFFERSIZE
         buffersize = int(argv.buffersize * 1024**2)
 
         action = compress if argv.decompress is False else decompress
@@ -71,19 +133,36 @@ def main() -> int:
         else:
             kind = schemes[True]
 
-        options = {'kind': kind, 'encoding': argv.encoding}
-        if argv.compress:
+        options = {'kind': kind, 'codec': argv.codec}
+        if action is compress:
             options['level'] = argv.level
 
-        writer = sys.stdout if argv.encoding is not None else sys.stdout.buffer
-        with BinaryStream(*argv.sources) as stream:
-            for buff in action(stream.iterbuffers(buffersize), **options):
+        writer = io.BufferedWriter(sys.stdout.buffer, buffer_size=WRITE_BUFFERSIZE)
+
+        if argv.workers > 1 and action is compress and kind == 'gzip' \
+                and argv.codec == 'isal' and igzip_threaded is not None:
+            # deflate independent blocks on worker threads as a single gzip member
+            with BinaryStream(*argv.sources) as stream, \
+                    igzip_threaded.open(writer, 'wb', compresslevel=_isal_level(argv.level),
+                                        threads=argv.workers) as output:
+                for buff in prefetch(stream.iterbuffers(buffersize), depth=PREFETCH_DEPTH):
+                    output.write(buff)
+        elif argv.workers > 1 and action is decompress and len(argv.sources) > 1:
+            for buff in _decompress_many(argv.sources, buffersize, argv.workers, **options):
                 writer.write(buff)
+        else:
+            # read, (de)compress, and write overlap on separate threads
+            with BinaryStream(*argv.sources) as stream:
+                buffers = prefetch(stream.iterbuffers(buffersize), depth=PREFETCH_DEPTH)
+                for buff in prefetch(action(buffers, **options), depth=PREFETCH_DEPTH):
+                    writer.write(buff)
 
     except KeyboardInterrupt:
         pass
 
     finally:
+        if writer is not None:
+            writer.detach()  # flush without closing stdout
         sys.stdout.buffer.flush()
 
     return 0
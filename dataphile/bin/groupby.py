@@ -15,54 +15,59 @@
 
 # standard libs
 import os
-import sys
+import io
+import csv
+import queue
 import itertools
-from io import BytesIO
-from typing import Any, Callable
+import multiprocessing
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Tuple, IO
 from argparse import ArgumentParser
 
-# external libs
-from pandas import read_csv
-import numpy as np
-
 # internal libs
-from ..io.stream import Stream
-from ..io.common import compression_formats, select_compression
+from ..io.stream import BinaryStream, page_align
+from ..io.common import select_reader, select_compression
+
 
+def _build_parser() -> ArgumentParser:
+    """Command-line interface (built on demand, not at import)."""
 
-parser = ArgumentParser(description=__doc__.split('\n')[0].strip())
+    parser = ArgumentParser(description=__doc__.split('\n')[0].strip())
 
-# positional arguments
-parser.add_argument('source', help='paths to files', metavar='FILE', nargs='*')
+    # positional arguments
+    parser.add_argument('source', help='paths to files', metavar='FILE', nargs='*')
 
-# options and flags
-parser.add_argument('-s', '--buffersize', help='buffer size (in MB)', type=float, default=0.256)
+    # options and flags
+    parser.add_argument('-s', '--buffersize', help='buffer size (in MB, rounded up to whole pages)',
+                        type=float, default=1.0)
 
-parser.add_argument('-f', '--field', help='label or column number to use as ID for groupby operation', default='0')
-parser.add_argument('-H', '--headers', help='number of headers (lines) in input files',
-                    dest='num_headers', type=int, default=0)
-parser.add_argument('-d', '--delimiter', help='char used to deliminate fields in the data', type=str, default=',')
-parser.add_argument('--slash', help='replacement char used for slashes ("/") in filenames', type=str, default='-')
-parser.add_argument('--colon', help='replacement char used for colons (":") in filenames', type=str, default='-')
+    parser.add_argument('-f', '--field', help='label or column number to use as ID for groupby operation', default='0')
+    parser.add_argument('-H', '--headers', help='number of headers (lines) in input files',
+                        dest='num_headers', type=int, default=0)
+    parser.add_argument('-d', '--delimiter', help='char used to deliminate fields in the data', type=str, default=',')
+    parser.add_argument('--slash', help='replacement char used for slashes ("/") in filenames', type=str, default='-')
+    parser.add_argument('--colon', help='replacement char used for colons (":") in filenames', type=str, default='-')
+    parser.add_argument('-j', '--workers', help='number of processes writing output files', type=int, default=1)
 
-# output path specification
-path_group = parser.add_mutually_exclusive_group()
-path_group.add_argument('-T', '--output-directory', help='path to output directory for files',
-                        dest='output_directory', type=str, default=None)  # default='.'
-path_group.add_argument('-o', '--output-pattern', help='pattern for output files',
-                        dest='output_pattern', type=str, default=None)  # default='%.csv'
-path_group.add_argument('--to', help='specify output file format',
-                        dest='output_filetype', type=str, default=None)  # default='csv'
-# available output formats: csv(.gz|bz(2)?|(xz|lzma))? -'d '
+    # output path specification
+    path_group = parser.add_mutually_exclusive_group()
+    path_group.add_argument('-T', '--output-directory', help='path to output directory for files',
+                            dest='output_directory', type=str, default=None)  # default='.'
+    path_group.add_argument('-o', '--output-pattern', help='pattern for output files',
+                            dest='output_pattern', type=str, default=None)  # default='%.csv'
+    path_group.add_argument('--to', help='specify output file format',
+                            dest='output_filetype', type=str, default=None)  # default='csv'
+    # available output formats: csv(.gz|bz(2)?|(xz|lzma))? -'d '
 
-# optional operations
-agg_group = parser.add_mutually_exclusive_group()
-agg_group.add_argument('--sum', help='apply summation to all numerical fields',
-                       action='store_const', const=np.sum)
-agg_group.add_argument('--mean', help='apply arithmetic mean to all fields',
-                       action='store_const', const=np.mean)
-agg_group.add_argument('--stdev', help='solve standard deviation (sample) to fields',
-                       action='store_const', const=np.std)
+    # optional operations (names of numpy functions, not yet implemented so rejected after parsing)
+    agg_group = parser.add_mutually_exclusive_group()
+    agg_group.add_argument('--sum', help='apply summation to all numerical fields',
+                           action='store_const', const='sum')
+    agg_group.add_argument('--mean', help='apply arithmetic mean to all fields',
+                           action='store_const', const='mean')
+    agg_group.add_argument('--stdev', help='solve standard deviation (sample) to fields',
+                           action='store_const', const='std')
+    return parser
 
 
 def _solve_output_path(namespace: Any, **repl_chars) -> Callable[..., str]:
@@ -78,52 +83,301 @@ def _solve_output_path(namespace: Any, **repl_chars) -> Callable[..., str]:
         return os.path.join(os.getcwd(), '{key}.csv').format
 
 
+class _RawBuffers(io.RawIOBase):
+    """Present an iterable of raw `buffers` as a readable (unbuffered) file."""
+
+    def __init__(self, buffers: Iterable[bytes]) -> None:
+        """Initialize with `buffers` (e.g., from `BinaryStream.iterbuffers`)."""
+        self._buffers = iter(buffers)
+        self._current = memoryview(b'')
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: bytearray) -> int:
+        """Copy as much of the current buffer as fits into `b`."""
+        while not self._current:
+            try:
+                self._current = memoryview(next(self._buffers))
+            except StopIteration:
+                return 0
+        size = min(len(b), len(self._current))
+        b[:size] = self._current[:size]
+        self._current = self._current[size:]
+        return size
+
+
+def _iterrows(buffers: Iterable[bytes], delimiter: str, buffer_size: int) -> Iterable[List[str]]:
+    """Parse the fields from `buffers` as one continuous CSV stream."""
+    text = io.TextIOWrapper(io.BufferedReader(_RawBuffers(buffers), buffer_size=buffer_size),
+                            encoding='utf-8', newline='')
+    return csv.reader(text, delimiter=delimiter)
+
+
+def _resolve_field(field: str, names: List[str]) -> int:
+    """Column index given either a label or a column number."""
+    try:
+        index = int(field)  # if this works then it was a number
+    except ValueError:
+        if names is None or field not in names:
+            raise ValueError(f'"{field}" does not name an available field')
+        return names.index(field)
+    if names is not None and index < 0:
+        index += len(names)  # can specify numeral even with named columns
+    if index < 0 or (names is not None and index >= len(names)):
+        raise ValueError(f'"{field}" does not name an available field'
+                         + ('' if names is None else f' (header has {len(names)} fields)'))
+    return index
+
+
+# rows parsed and grouped together before writing
+GROUP_BATCH_ROWS = 50000
+
+# each unique group holds an open file, beyond this we close the least recently used
+MAX_OPEN_FILES = 512
+
+# compressed outputs favor speed (the keyword for the level differs for lzma)
+COMPRESSION_LEVELS = {'gzip': {'compresslevel': 1},
+                      'bzip': {'compresslevel': 1},
+                      'lzma': {'preset': 1}}
+
+# rows for each group are formatted and held until there are this many bytes to write at once
+PENDING_BUFFERSIZE = 64 * 1024
+
+
+class _Outputs:
+    """Output files for each group, opened on first use and held for the whole run."""
+
+    def __init__(self, header: List[str]=None, maxsize: int=MAX_OPEN_FILES) -> None:
+        """Initialize with `header` to write to new files."""
+        self.header = header
+        self.maxsize = maxsize
+        self._files = OrderedDict()  # filename -> (file, pending bytes)
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text, lineterminator='\n')
+
+    def _format(self, rows: List[List[str]]) -> bytes:
+        """Format `rows` as encoded CSV."""
+        self._text.seek(0)
+        self._text.truncate()
+        self._writer.writerows(rows)
+        return self._text.getvalue().encode('utf-8')
+
+    def _open(self, filename: str) -> Tuple[IO, bytearray]:
+        """Open `filename` for appending, write header if new."""
+        exists = os.path.exists(filename)
+        if len(self._files) >= self.maxsize:
+            _, (old, pending) = self._files.popitem(last=False)
+            old.write(pending)
+            old.close()
+        compression = select_compression(filename)
+        if compression is None:
+            file = open(filename, mode='ab')
+        else:
+            reader = select_reader(filename)  # infers compression (e.g., gzip.open)
+            file = reader(filename, mode='ab', **COMPRESSION_LEVELS[compression])
+        pending = bytearray()
+        if not exists and self.header is not None:
+            pending += self._format([self.header])
+        self._files[filename] = file, pending
+        return file, pending
+
+    def write(self, filename: str, rows: List[List[str]]) -> None:
+        """Write `rows` to `filename`."""
+        try:
+            file, pending = self._files[filename]
+            self._files.move_to_end(filename)
+        except KeyError:
+            file, pending = self._open(filename)
+        pending += self._format(rows)
+        if len(pending) >= PENDING_BUFFERSIZE:
+            file.write(pending)
+            pending.clear()
+
+    def close(self) -> None:
+        """Write pending rows and close all open files."""
+        for file, pending in self._files.values():
+            file.write(pending)
+            file.close()
+        self._files.clear()
+
+
+# rows collected for a worker before sending them, and batches held in its queue
+WORKER_BATCH_ROWS = 10000
+WORKER_QUEUE_DEPTH = 4
+
+# seconds to wait on a full queue before checking the worker is still alive
+WORKER_POLL_INTERVAL = 0.1
+
+
+def _write_worker(index: int, tasks: multiprocessing.Queue, errors: multiprocessing.Queue,
+                  header: List[str], maxsize: int) -> None:
+    """Write batches of (filename, rows) from `tasks` until None is received."""
+    outputs = _Outputs(header, maxsize)
+    try:
+        for batch in iter(tasks.get, None):
+            for filename, rows in batch:
+                outputs.write(filename, rows)
+        outputs.close()
+    except KeyboardInterrupt:
+        outputs.close()
+    except Exception as error:
+        # NOTE: the exception itself may not pickle, the parent only needs to report it
+        errors.put((index, f'{error.__class__.__name__}: {error}'))
+        raise SystemExit(1)
+
+
+class _Workers:
+    """
+    Output files for each group, partitioned over worker processes.
+
+    Each filename always goes to the same worker so no two processes
+    ever write to the same file. If any worker fails the others are
+    stopped and the error is raised in the parent.
+    """
+
+    def __init__(self, header: List[str]=None, workers: int=2, maxsize: int=MAX_OPEN_FILES) -> None:
+        """Start `workers` processes holding at most `maxsize` open files between them."""
+        self._queues = [multiprocessing.Queue(WORKER_QUEUE_DEPTH) for _ in range(workers)]
+        self._errors = multiprocessing.Queue()
+        self._pending = [[] for _ in range(workers)]
+        self._sizes = [0 for _ in range(workers)]
+        self._processes = [multiprocessing.Process(target=_write_worker, daemon=True,
+                                                   args=(index, tasks, self._errors, header,
+                                                         max(1, maxsize // workers)))
+                           for index, tasks in enumerate(self._queues)]
+        self._stopped = set()  # indices of workers terminated from here
+        self._failed = False
+        for process in self._processes:
+            process.start()
+
+    def _put(self, index: int, item: Any) -> None:
+        """Put `item` on the queue for worker at `index`, failing if it has exited."""
+        while True:
+            try:
+                self._queues[index].put(item, timeout=WORKER_POLL_INTERVAL)
+                return
+            except queue.Full:
+                if not self._processes[index].is_alive():
+                    self._fail()
+
+    def _send(self, index: int) -> None:
+        """Send pending rows to worker at `index`."""
+        if not self._processes[index].is_alive():
+            self._fail()
+        self._put(index, self._pending[index])
+        self._pending[index] = []
+        self._sizes[index] = 0
+
+    def _stop(self) -> None:
+        """Terminate any remaining workers without waiting on their queues."""
+        for tasks in self._queues:
+            tasks.cancel_join_thread()  # NOTE: otherwise exit waits to flush to dead readers
+        for index, process in enumerate(self._processes):
+            if process.is_alive():
+                process.terminate()
+                self._stopped.add(index)
+            process.join()
+
+    def _fail(self) -> None:
+        """Stop all workers and raise the error(s) reported by those that failed."""
+        self._failed = True
+        self._stop()
+        messages = dict()
+        try:
+            while True:
+                index, message = self._errors.get(timeout=WORKER_POLL_INTERVAL)
+                messages[index] = message
+        except queue.Empty:
+            pass
+        failed = [f'worker {index}: ' + messages.get(index, f'exited (code {process.exitcode})')
+                  for index, process in enumerate(self._processes)
+                  if index in messages or (process.exitcode != 0 and index not in self._stopped)]
+        raise RuntimeError('groupby failed to write outputs ('
+                           + ('; '.join(failed) or 'a worker exited early') + ')')
+
+    def write(self, filename: str, rows: List[List[str]]) -> None:
+        """Write `rows` to `filename` (on whichever worker owns it)."""
+        index = hash(filename) % len(self._queues)
+        self._pending[index].append((filename, rows))
+        self._sizes[index] += len(rows)
+        if self._sizes[index] >= WORKER_BATCH_ROWS:
+            self._send(index)
+
+    def close(self) -> None:
+        """Send remaining rows and wait for workers to close their files."""
+        if self._failed:
+            return  # already stopped (and raised)
+        try:
+            for index in range(len(self._queues)):
+                if self._pending[index]:
+                    self._send(index)
+                self._put(index, None)
+            for process in self._processes:
+                process.join()
+        except BaseException:
+            if not self._failed:
+                self._failed = True
+                self._stop()
+            raise
+        if any(process.exitcode != 0 for process in self._processes):
+            self._fail()
+
 
 def main() -> int:
     """Entry point for 'groupby' command."""
 
+    parser = _build_parser()
     opt = parser.parse_args()
+    for flag in 'sum', 'mean', 'stdev':
+        if getattr(opt, flag) is not None:
+            parser.error(f'--{flag} is not supported yet (groupby only splits rows into files)')
     path_fmt = _solve_output_path(opt)  # e.g., path_fmt(key=...) gives ./[key].csv
-    compression = select_compression(path_fmt(key='dummy_id'))
-    buffer_size = int(opt.buffersize * 1024**2)
+    buffer_size = page_align(int(opt.buffersize * 1024**2))
 
+    outputs = None
     try:
-        with Stream(*opt.source) as source:
+        with BinaryStream(*opt.source) as source:
+            # a single reader over all of the data (quoted fields may span buffers)
+            rows = _iterrows(source.iterbuffers(buffer_size), opt.delimiter, buffer_size)
+
             # extract headers if present and define column names
+            # consume N lines off the first file or stream; assume N reps location
             if opt.num_headers != 0:
-                # consume N lines off the first file or stream; assume N reps location
-                header = list(itertools.islice(source.files[0], opt.num_headers))[-1].decode().strip()
-                names = [field.strip() for field in header.split(opt.delimiter)]
+                names = [field.strip() for field in list(itertools.islice(rows, opt.num_headers))[-1]]
             else:
-                header, names = None, None
+                names = None
+
             # define field identifiers (enumerated if not explicitly labeled)
-            try:
-                key = int(opt.field)  # if this works then it was a number
-                if header is not None:
-                    key = names[key]  # can specify numeral even with named columns
-            except ValueError:
-                if header is None or opt.field not in names:
-                    raise ValueError('"{}" does not name an available field'.format(key))
-                else:
-                    key = opt.field
-
-            # read off in whole line increments
-            for data in source.readlines(buffer_size):
-                # create data frame and append to files grouped by specified field
-                frame = read_csv(BytesIO(data), header=None, names=names, sep=opt.delimiter)
-                for group_name, group_data in frame.groupby(key):
-                    if len(group_data) < 1: continue
+            key = _resolve_field(opt.field, names)
+            header = None if names is None else names[:key] + names[key+1:]
+            outputs = _Outputs(header) if opt.workers < 2 else _Workers(header, opt.workers)
+
+            def write(groups: Dict[str, List[List[str]]]) -> None:
+                for group_name, group_data in groups.items():
                     filename = path_fmt(key=group_name.replace('/', opt.slash).replace(':', opt.colon))
-                    output = group_data.drop([key], axis=1)  # no need for saving the group_name
-                    if not os.path.exists(filename) and header is not None:
-                        output.to_csv(filename, index=False, encoding='utf-8', mode='a',
-                                      compression=compression, header=True)
-                    else:
-                        output.to_csv(filename, index=False, encoding='utf-8', mode='a',
-                                      compression=compression, header=False) # may already have header
+                    outputs.write(filename, group_data)
 
+            # group rows by specified field (no need for saving the group_name)
+            groups, count = defaultdict(list), 0
+            for row in rows:
+                if len(row) <= key:
+                    if not row:
+                        continue  # blank line
+                    raise ValueError(f'line {rows.line_num} has {len(row)} field(s), '
+                                     f'no field "{opt.field}" to group by')
+                groups[row[key]].append(row[:key] + row[key+1:])
+                count += 1
+                if count == GROUP_BATCH_ROWS:
+                    write(groups)
+                    groups, count = defaultdict(list), 0
+            write(groups)
 
     except (BrokenPipeError, KeyboardInterrupt):
         pass
 
+    finally:
+        if outputs is not None:
+            outputs.close()
+
     return 0  # sys.exit(0)
@@ -14,22 +14,39 @@
 
 
 # standard libs
+import io
 import sys
 import argparse
+import functools
 
-# external libs
-from tqdm import tqdm
 
-parser = argparse.ArgumentParser(prog=__doc__.split('\n')[0].split('.')[-1].strip(),  # gunzip
-                                 description='\n'.join(__doc__.split('\n')[1:]))
-parser.add_argument('-t', '--total-bytes', help='use total bytes to display ETC', type=int, default=None, dest='total_bytes')
+def _build_parser() -> argparse.ArgumentParser:
+    """Command-line interface (built on demand, not at import)."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-t', '--total-bytes', help='use total bytes to display ETC', type=int, default=None, dest='total_bytes')
+    return parser
+
+
+# read whatever is available (up to 64 KB) instead of scanning for lines,
+# batch writes to stdout to cut down on syscalls for small records
+READ_BUFFERSIZE = 64 * 1024
+WRITE_BUFFERSIZE = 256 * 1024
 
 
 def main() -> int:
     """Entry point for 'monitor' script."""
-    opt = parser.parse_args()
-    with tqdm(total=opt.total_bytes, unit='B', unit_scale=True) as monitor:
-        for data in sys.stdin.buffer:
-            monitor.update(len(data))
-            sys.stdout.buffer.write(data)
+    opt = _build_parser().parse_args()
+
+    # NOTE: defer import of external libs until needed (not for --help)
+    from tqdm import tqdm
+
+    writer = io.BufferedWriter(sys.stdout.buffer, buffer_size=WRITE_BUFFERSIZE)
+    try:
+        with tqdm(total=opt.total_bytes, unit='B', unit_scale=True) as monitor:
+            for data in iter(functools.partial(sys.stdin.buffer.read1, READ_BUFFERSIZE), b''):
+                monitor.update(len(data))
+                writer.write(data)
+    finally:
+        writer.detach()  # flush without closing stdout
     return 0
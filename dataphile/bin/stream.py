@@ -15,17 +15,20 @@
 # standard libs
 import os
 import sys
+import stat
+import mmap
 import argparse
-import platform
-
-# external libs
-from tqdm import tqdm
+import functools
+import itertools
+import threading
+from typing import List, Tuple, Callable, Generator, Any
 
 # internal libs
-from ..io.stream import BinaryStream, LiveBinaryStream
+from ..io.stream import BinaryStream, LiveBinaryStream, page_align
+from ..io.pipeline import prefetch
 
 
-if platform.system() == 'Windows':
+if sys.platform.startswith('win'):
     # FIXME: how do we ignore broken pipes on windows?
     pass
 else:
@@ -33,48 +36,248 @@ else:
     signal(SIGPIPE, SIG_DFL)
 
 
-parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
-parser.add_argument('sources', metavar='FILE', nargs='+',
-                    help='paths to data files')
-parser.add_argument('-b', '--buffersize', type=float, default=1.0,
-                    help='buffer size (in MB)')
-parser.add_argument('-m', '--monitor', dest='use_progress_bar', action='store_true',
-                    help='display progress bar')
-live_group = parser.add_mutually_exclusive_group()
-live_group.add_argument('-l', '--live', action='store_true',
-                        help='maintain connection and wait for new data')
-live_group.add_argument('-L', '--latency', type=float, default=0.1,
-                        help='maintain connection and wait for new data')
+def _build_parser() -> argparse.ArgumentParser:
+    """Command-line interface (built on demand, not at import)."""
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0].strip())
+    parser.add_argument('sources', metavar='FILE', nargs='+',
+                        help='paths to data files')
+    parser.add_argument('-b', '--buffersize', type=float, default=1.0,
+                        help='buffer size (in MB, rounded up to whole pages)')
+    parser.add_argument('-m', '--monitor', dest='use_progress_bar', action='store_true',
+                        help='display progress bar')
+    live_group = parser.add_mutually_exclusive_group()
+    live_group.add_argument('-l', '--live', action='store_true',
+                            help='maintain connection and wait for new data')
+    live_group.add_argument('--mmap', dest='use_mmap', action='store_true',
+                            help='memory-map files instead of reading them')
+    live_group.add_argument('-L', '--latency', type=float, default=0.1,
+                            help='maintain connection and wait for new data')
+    return parser
+
+
+def _can_sendfile(fd: int) -> bool:
+    """Check if files can be copied to `fd` in-kernel with `os.sendfile`."""
+    if not hasattr(os, 'sendfile'):
+        return False
+    try:
+        mode = os.fstat(fd).st_mode
+    except OSError:
+        return False
+    if stat.S_ISSOCK(mode):
+        return True
+    # NOTE: only Linux accepts regular files as the output, and not when opened to append (>>)
+    if stat.S_ISREG(mode) and sys.platform.startswith('linux'):
+        import fcntl
+        return not fcntl.fcntl(fd, fcntl.F_GETFL) & os.O_APPEND
+    return False
+
+
+def _sized_files(sources: List[str]) -> bool:
+    """
+    Check that all of `sources` are regular files that report their size.
+    `_sendfile` copies `st_size` bytes, which is zero for FIFOs, `<(cmd)`, and files in /proc.
+    """
+    for source in sources:
+        try:
+            info = os.stat(source)
+        except OSError:
+            return False  # the stream itself will report the missing file
+        if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+            return False
+    return True
+
+
+# largest single sendfile call (Linux will not transfer more than this at once)
+SENDFILE_MAX = 0x7ffff000
+
+
+def _count_total(monitor: Any, sources: List[str]) -> threading.Thread:
+    """Add up the size of `sources` for the progress bar on a background thread."""
+    def count() -> None:
+        total = 0
+        for source in sources:
+            try:
+                total += os.path.getsize(source)
+            except OSError:
+                return  # the stream itself will report the missing file
+            monitor.total = total
+        monitor.refresh()
+    thread = threading.Thread(target=count, daemon=True)
+    thread.start()
+    return thread
+
+
+def _noop(size: int) -> None:
+    """Stand-in for `tqdm.update` without a progress bar."""
+
+
+def _sendfile(sources: List[str], fd: int, count: int, update: Callable[[int], None]=_noop) -> None:
+    """Copy `sources` to `fd` in calls of `count` bytes without passing data through user space."""
+    for source in sources:
+        with open(source, mode='rb') as file:
+            offset, size = 0, os.fstat(file.fileno()).st_size
+            while offset < size:
+                sent = os.sendfile(fd, file.fileno(), offset, min(count, size - offset))
+                if sent == 0:
+                    break  # file was truncated
+                offset += sent
+                update(sent)
+
+
+def _can_splice(fd: int) -> bool:
+    """Check if files can be moved into `fd` in-kernel with `os.splice` (Linux, output is a pipe)."""
+    if not hasattr(os, 'splice'):
+        return False
+    try:
+        return stat.S_ISFIFO(os.fstat(fd).st_mode)
+    except OSError:
+        return False
+
+
+def _splice(sources: List[str], fd: int, count: int, update: Callable[[int], None]=_noop) -> None:
+    """Move `sources` into the pipe `fd` in calls of `count` bytes without passing through user space."""
+    for source in sources:
+        with open(source, mode='rb') as file:
+            for size in iter(functools.partial(os.splice, file.fileno(), fd, count,
+                                               flags=os.SPLICE_F_MOVE), 0):
+                update(size)
+
+
+# pages requested ahead of time when memory-mapping a file
+MMAP_READAHEAD = 64 * 1024**2
+
+
+def _madvise(mapped: mmap.mmap, option: str, *args: int) -> None:
+    """Advise the kernel about access pattern, if supported on this platform."""
+    if hasattr(mmap, option) and hasattr(mapped, 'madvise'):
+        mapped.madvise(getattr(mmap, option), *args)
+
+
+def _write_mmap(sources: List[str], write: Callable[[memoryview], int], buffsize: int,
+                update: Callable[[int], None]=_noop) -> None:
+    """Write memory-mapped `sources` in slices, releasing pages as they are written."""
+    for source in sources:
+        with open(source, mode='rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                continue  # cannot map an empty file
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                _madvise(mapped, 'MADV_SEQUENTIAL')
+                _madvise(mapped, 'MADV_WILLNEED', 0, min(size, MMAP_READAHEAD))
+                with memoryview(mapped) as view:
+                    for offset in range(0, size, buffsize):
+                        write(view[offset:offset+buffsize])
+                        # NOTE: offsets are multiples of buffsize, page aligned if buffsize is
+                        if offset % mmap.PAGESIZE == 0:
+                            _madvise(mapped, 'MADV_DONTNEED', offset, min(buffsize, size - offset))
+                        update(min(buffsize, size - offset))
+
+
+# small buffers are gathered into a single write of about this many bytes (at most WRITEV_MAX buffers)
+WRITEV_BUFFERSIZE = 1024**2
+WRITEV_MAX = 8
+
+# batches read ahead on a background thread while the last is written
+PREFETCH_DEPTH = 2
+
+
+def _iterbatches(stream: BinaryStream, buffsize: int, count: int,
+                 sets: int=1) -> Generator[Tuple[List[memoryview], int], None, None]:
+    """
+    Fill up to `count` reused buffers from `stream` and yield views of those read (and total size).
+    Buffers are reused after `sets` batches (more than one is needed if batches are consumed later).
+    """
+    rings = [[(buff, memoryview(buff)) for buff in (bytearray(buffsize) for _ in range(count))]
+             for _ in range(sets)]
+    readinto = stream.readinto  # NOTE: bound once, called for every buffer
+    for buffers in itertools.cycle(rings):
+        batch, total = [], 0
+        for buff, view in buffers:
+            size = readinto(buff)
+            if not size:
+                break
+            batch.append(view[:size])
+            total += size
+        if batch:
+            yield batch, total
+        if len(batch) < count:
+            return
+
+
+def _writev(fd: int, views: List[memoryview]) -> None:
+    """Write all of `views` to `fd` with as few system calls as possible."""
+    views = list(views)
+    while views:
+        written = os.writev(fd, views)
+        # writes to pipes may be partial, drop what was written and go again
+        while views and written >= len(views[0]):
+            written -= len(views.pop(0))
+        if views:
+            views[0] = views[0][written:]
 
 
 def main() -> int:
     """Entry point for 'stream' command."""
 
     monitor = None
+    counter = None
 
     try:
-        argv = parser.parse_args()
+        argv = _build_parser().parse_args()
         Stream = LiveBinaryStream if argv.live is True else BinaryStream
-        buffsize = int(argv.buffersize * 1024**2)
+        buffsize = page_align(int(argv.buffersize * 1024**2))
 
         options = dict()
         if argv.live is True:
             options.update({'latency': argv.latency})
 
         if argv.use_progress_bar is True:
-            monitor = tqdm(total=sum(map(os.path.getsize, argv.sources)),
-                           unit='B', unit_scale=True, unit_divisor=1024)
+            from tqdm import tqdm  # NOTE: only import external libs when needed
+            # NOTE: stream starts right away, the total is filled in as sources are found
+            monitor = tqdm(total=None, unit='B', unit_scale=True, unit_divisor=1024)
+            counter = _count_total(monitor, argv.sources)
+
+        # bound once so the loops below never check for a progress bar
+        update = _noop if monitor is None else monitor.update
+
+        if argv.use_mmap is True:
+            _write_mmap(argv.sources, sys.stdout.buffer.write, buffsize, update)
+            return 0
+
+        if argv.live is False and _can_sendfile(sys.stdout.fileno()) and _sized_files(argv.sources):
+            # smaller calls are only needed to report progress
+            sys.stdout.buffer.flush()
+            _sendfile(argv.sources, sys.stdout.fileno(),
+                      SENDFILE_MAX if monitor is None else buffsize, update)
+            return 0
+
+        if argv.live is False and _can_splice(sys.stdout.fileno()):
+            sys.stdout.buffer.flush()
+            _splice(argv.sources, sys.stdout.fileno(), buffsize, update)
+            return 0
 
+        # buffers are reused for every read, several small ones are written at once
+        # NOTE: live streams wait for new data so are never held back in a batch
+        if hasattr(os, 'writev'):
+            sys.stdout.buffer.flush()
+            write = functools.partial(_writev, sys.stdout.fileno())
+            count = 1 if argv.live is True else min(WRITEV_MAX, max(1, WRITEV_BUFFERSIZE // buffsize))
+        else:
+            write, count = sys.stdout.buffer.writelines, 1
+        # reading happens on a background thread (buffers are not reused until written)
         with Stream(*argv.sources, **options) as stream:
-            for buff in stream.iterbuffers(buffsize):
-                sys.stdout.buffer.write(buff)
-                if monitor is not None:
-                    monitor.update(len(buff))
+            batches = _iterbatches(stream, buffsize, count, sets=PREFETCH_DEPTH + 2)
+            for batch, size in prefetch(batches, depth=PREFETCH_DEPTH):
+                write(batch)
+                update(size)
 
     except KeyboardInterrupt:
         pass
 
     finally:
+        if counter is not None:
+            counter.join()
         if monitor is not None:
             monitor.close()
 
@@ -13,17 +13,23 @@
 """Dynamic/colorized logging facility."""
 
 # standard libs
-import datetime as dt
+import time
 
 # external libs
 from logalpha import ConsoleHandler, BaseLogger
 
+
+def _timestamp() -> str:
+    """Current local time for messages (evaluated once per message)."""
+    return time.strftime('%H:%M:%S')  # NOTE: cheaper than building a datetime each time
+
+
 # simple console logger
 _basic_console_handler = ConsoleHandler(level='info',
                                         template='{level} {timestamp} {message}',
-                                        timestamp=lambda: dt.datetime.now().strftime('%H:%M:%S'))
+                                        timestamp=_timestamp)
 
 # _basic_file_handler = FileHandler(template='{LEVEL}:num {timestamp} {name}: {message}',
-#                                   timestamp=lambda: dt.datetime.now().strftime('%H:%M:%S'))
+#                                   timestamp=_timestamp)
 
 log = BaseLogger([_basic_console_handler])
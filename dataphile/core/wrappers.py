@@ -13,8 +13,42 @@
 """Wrappers used by the Dataphile package."""
 
 
-# Windows doesn't work with 'signal' package, so implement using multiprocessing
-from multiprocessing import Process, Queue
+# standard libs
+import time
+import signal
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+
+# NOTE: Windows (and any thread but the main thread) cannot use SIGALRM, calls go to
+# a shared pool instead where a call that times out is abandoned (not stopped).
+_executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared thread pool (created on first use)."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix='dataphile-timeout')
+    return _executor
+
+
+class _Timeout(BaseException):
+    """
+    Raised by the alarm handler to interrupt the call.
+    Not an `Exception`, so a bare `except Exception` in the call cannot swallow it.
+    """
+
+
+def _alarm(signum, frame):
+    """Signal handler for SIGALRM."""
+    raise _Timeout()
+
+
+def _can_alarm() -> bool:
+    """SIGALRM is only available on POSIX and only handled in the main thread."""
+    return hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
 
 
 def timeout(seconds, action=None):
@@ -22,27 +56,46 @@ def timeout(seconds, action=None):
        If a timeout occurs, 'action' will be returned or called if
        it is a function-like object.
     """
-    def handler(queue, func, args, kwargs):
-        queue.put(func(*args, **kwargs))
+    def on_timeout():
+        if hasattr(action, '__call__'):
+            return action()
+        else:
+            return action
 
     def decorator(func):
 
+        @functools.wraps(func)
         def wraps(*args, **kwargs):
-            q = Queue()
-            p = Process(target=handler, args=(q, func, args, kwargs))
-            p.start()
-            p.join(timeout=seconds)
-            if p.is_alive():
-                p.terminate()
-                p.join()
-                if hasattr(action, '__call__'):
-                    return action()
-                else:
-                    return action
-            else:
-                return q.get()
+            if not _can_alarm():
+                future = _get_executor().submit(func, *args, **kwargs)
+                try:
+                    return future.result(timeout=seconds)
+                except FutureTimeout:
+                    return on_timeout()
+
+            # an outer timeout (nested calls) that fires first is left to do so
+            delay, interval = signal.getitimer(signal.ITIMER_REAL)
+            if 0 < delay <= seconds:
+                return func(*args, **kwargs)
+
+            previous = signal.signal(signal.SIGALRM, _alarm)
+            start = time.monotonic()
+            try:
+                signal.setitimer(signal.ITIMER_REAL, seconds)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            except _Timeout:
+                return on_timeout()
+            finally:
+                if previous is not None:  # None if not installed from Python
+                    signal.signal(signal.SIGALRM, previous)
+                if delay > 0:
+                    # re-arm the outer timeout with what is left of it (fire right away if nothing)
+                    remaining = max(delay - (time.monotonic() - start), 1e-6)
+                    signal.setitimer(signal.ITIMER_REAL, remaining, interval)
 
         return wraps
 
     return decorator
-
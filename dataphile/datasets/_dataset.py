@@ -35,7 +35,7 @@ class SyntheticDataset(Dataset):
                  linspace: bool=False,
                  ordered: bool=False,
                  noise: float=0.05,
-                 seed: Number=None):
+                 seed: Union[Number, np.random.Generator]=None):
         """Define the distribution."""
 
         # descriptions and type checking are done via 'property' definitions
@@ -55,12 +55,19 @@ class SyntheticDataset(Dataset):
         if self.linspace is True:
             xdata = np.linspace(*self.domain, self.samples)
         else:
-            xdata = np.random.uniform(*self.domain, self.samples)
+            xdata = self.rng.uniform(*self.domain, self.samples)
             if self.ordered is True:
                 xdata.sort()
 
         ydata = self.distribution(xdata, *self.parameters)
-        ydata += np.random.normal(0., self.noise * (ydata.max() - ydata.min()), self.samples)
+        if self.noise > 0:
+            # unit normal draws scaled in place (no need to draw anything without noise)
+            # NOTE: the noise is never returned, so its buffer is reused by later calls
+            if self.__noise_buffer is None:
+                self.__noise_buffer = np.empty(self.samples)
+            noise = self.rng.standard_normal(out=self.__noise_buffer)
+            noise *= self.noise * np.ptp(ydata)
+            ydata += noise
 
         return xdata, ydata
 
@@ -79,15 +86,20 @@ class SyntheticDataset(Dataset):
             raise TypeError('SyntheticDataset.distribution must be a callable function.')
 
     @property
-    def parameters(self) -> List[Number]:
+    def parameters(self) -> np.ndarray:
         """Parameters used to evaluate the distribution."""
         return self.__parameters
 
     @parameters.setter
     def parameters(self, value: List[Number]) -> None:
         """Set the parameters used to evaluate the distribution."""
-        if hasattr(value, '__iter__') and all(isinstance(v, Number) for v in value):
-            self.__parameters = list(value)
+        try:
+            # NOTE: a single conversion checks the type of every value at once
+            array = np.asarray(value)
+        except ValueError:
+            array = None
+        if array is not None and array.ndim == 1 and array.dtype.kind in 'biufc':
+            self.__parameters = array
         else:
             raise ValueError('SyntheticDataset.parameters must be a list of numeric values.')
 
@@ -114,6 +126,7 @@ class SyntheticDataset(Dataset):
         """Set the number of samples to take from the distribution."""
         if isinstance(value, int):
             self.__samples = value
+            self.__noise_buffer = None  # allocated on next call to `generate`
         else:
             raise ValueError('SyntheticDataset.samples must be an integer value.')
 
@@ -144,17 +157,23 @@ class SyntheticDataset(Dataset):
             raise ValueError('SyntheticDataset.noise must be a number between 0 and 1.')
 
     @property
-    def seed(self) -> Number:
+    def seed(self) -> Union[Number, np.random.Generator]:
         """A numerical value to use to seed the random number generator (for reproducibility)."""
         return self.__seed
 
     @seed.setter
-    def seed(self, value: Number) -> None:
-        """Set the seed value for the random number generator."""
-        if isinstance(value, Number):
+    def seed(self, value: Union[Number, np.random.Generator]) -> None:
+        """
+        Set the seed value for the random number generator.
+        An existing `np.random.Generator` may be given to share it between datasets.
+        """
+        if value is None or isinstance(value, (Number, np.random.Generator)):
             self.__seed = value
-            np.random.seed(value)
-        elif value is None:
-            self.__seed = None
+            self.__rng = np.random.default_rng(value)
         else:
             raise ValueError('SyntheticDataset.seed must be a number.')
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """The random number generator for this dataset (created from `seed`)."""
+        return self.__rng
@@ -74,7 +74,7 @@ class Linear(Demo):
                            Parameter(value=1.0, bounds=(-3, 3), label='slope'),
                            label='linear')
 
-        self.xsample = np.linspace(-1, 2, 150)
+        self.xsample = np.linspace(-1, 2, 150, dtype=np.float32)
         self.model_curve, = plot.plot(self.xsample, self.model(self.xsample), 'k--',
                                       label=self.model.label + ' model', lw=2, zorder=20)
         plot.legend(loc='upper left')
@@ -122,7 +122,7 @@ class Sinusoidal(Demo):
         self.ax.set_ylabel(r'$y = A + B \sin\left(\phi x - \rho \right)$', labelpad=15)
 
         # create AutoGUI
-        self.xsample = np.linspace(-2, 6, 2000)
+        self.xsample = np.linspace(-2, 6, 2000, dtype=np.float32)
         self.model_curve, = plot.plot(self.xsample, self.model(self.xsample), 'k--',
                                       label='model', lw=2, zorder=20)
 
@@ -138,29 +138,34 @@ class GaussianPeaks(Demo):
     def __init__(self):
         """Create synthetic dataset, plots, and AutoGUI."""
         # polynomial background (bias distribution across detector)
-        super().__init__(polynomial1D, [100, -0.01, -1e-5], (0, 2400), linspace=True,
-                         noise=0, samples=2400)
-
-        # randomly generate gaussian peaks
-        np.random.seed(33)
+        # NOTE: without noise it is evaluated directly, `dataset` only describes it (as for other demos)
+        coeffs = [100, -0.01, -1e-5]
+        self.dataset = SyntheticDataset(polynomial1D, coeffs, (0, 2400), linspace=True,
+                                        noise=0, samples=2400)
+        self.xdata = np.linspace(*self.dataset.domain, self.dataset.samples)
+        bias = np.polynomial.polynomial.polyval(self.xdata, coeffs)
+
+        # randomly generate gaussian peaks (one generator shared by all for reproducibility)
+        rng   = np.random.default_rng(33)
         N     = 24
-        A_s   = np.random.uniform(50, 150, N)
-        x0_s  = np.random.uniform(100, 2300, N)
-        sig_s = np.random.uniform(10, 20, N)
-        peaks = [SyntheticDataset(gaussian1D, [A, x0, sig], (0, 2400), linspace=True,
-                                  noise=0.015, samples=2400).generate()[1]
-                 for A, x0, sig in zip(A_s, x0_s, sig_s)]
+        A_s   = rng.uniform(50, 150, N)
+        x0_s  = rng.uniform(100, 2300, N)
+        sig_s = rng.uniform(10, 20, N)
+
+        # evaluate every peak at once (one row each), with noise relative to each peak
+        peaks  = gaussian1D(self.xdata, A_s[:, None], x0_s[:, None], sig_s[:, None])
+        peaks += 0.015 * np.ptp(peaks, axis=1, keepdims=True) * rng.standard_normal(peaks.shape)
 
-        # superimpose gaussian features over background
-        bias = self.ydata
-        self.ydata += sum(peaks)
+        # superimpose gaussian features over background (keeping the background as is)
+        self.ydata = bias + peaks.sum(axis=0)
 
         figure = plot.figure('Guassian Peaks Demonstration with AutoGUI', figsize=(9, 7))
         self.figure = figure
 
-        # select region of dataset for fitting
-        xdata_i = self.xdata[self.xdata < 400]
-        ydata_i = self.ydata[self.xdata < 400]
+        # select region of dataset for fitting (xdata is sorted, so slice instead of masking)
+        stop = np.searchsorted(self.xdata, 400)
+        xdata_i = self.xdata[:stop]
+        ydata_i = self.ydata[:stop]
 
         # create main plot
         ax_2 = figure.add_axes([0.15, 0.30, 0.84, 0.56])
@@ -173,7 +178,7 @@ class GaussianPeaks(Demo):
         # whole dataset graph
         ax_1 = figure.add_axes([0.05, 0.73, 0.45, 0.24])
         graph, = ax_1.step(self.xdata, self.ydata, color='black', lw=1)
-        xloc, yloc = x0_s, [(bias + peak).max() + 50 for peak in peaks]
+        xloc, yloc = x0_s, (bias + peaks).max(axis=1) + 50  # top of each peak
         markers = ax_1.scatter(xloc, yloc, marker='v', color='steelblue')
         rectangle = patches.Rectangle((0, 50), 400, 250, color='gray', alpha=0.50)
         ax_1.add_patch(rectangle)
@@ -202,7 +207,7 @@ class GaussianPeaks(Demo):
                   label='feature_3'),
             label='gaussian_peaks')
 
-        xsample = np.linspace(0, 400, 1500)
+        xsample = np.linspace(0, 400, 1500, dtype=np.float32)
         model_curve, = ax_2.plot(xsample, model(xsample), color='steelblue', label='model')
         ax_2.legend()
 
@@ -17,7 +17,14 @@ from typing import List, Tuple, Callable
 
 import matplotlib as mpl
 import matplotlib.figure
+import matplotlib.backend_bases
 from matplotlib import widgets
+from matplotlib.transforms import Bbox
+
+
+# milliseconds to hold changes in value before updating the UX (about one frame)
+UX_INTERVAL = 16
+
 
 class Slider:
     """Built on `matplotlib.Slider` to create modern looking slider."""
@@ -47,6 +54,12 @@ class Slider:
         # create overlaying widget layer
         self._create_widget_layer()
 
+        # only re-draw the moving parts while the knob is dragged (if supported)
+        self._create_blit()
+
+        # changes in value are held and only the last is drawn (if the backend has timers)
+        self._create_timer()
+
         # basic update (override with 'on_changed')
         def update(value):
             self._update_ux(value)
@@ -101,9 +114,75 @@ class Slider:
         self.widget.vline.set_visible(False)
         self.widget.poly.set_edgecolor('none')
         self.widget.poly.fill = False
+        for name in 'track', '_handle':  # newer matplotlib draws its own track and knob over the UX
+            if getattr(self.widget, name, None) is not None:
+                getattr(self.widget, name).set_visible(False)
         self.widget.label.set_position([self.widget.label.get_position()[0] - pad/2, 0.5])
         self.widget.valtext.set_position([self.widget.valtext.get_position()[0] + pad/2, 0.5])
 
+    def _create_blit(self):
+        """Connect events to make the moving elements animated (and blit them) while dragging."""
+
+        self._blitting = False
+        self._background = None
+        self._cids = list()
+        self._animated = [self._ux_line_filled, self._ux_knob, self.widget.valtext]
+
+        canvas = self.figure.canvas
+        if canvas.supports_blit:
+            self.widget.drawon = False  # drawing is done in `_update_ux`
+            self._cids = [canvas.mpl_connect('button_press_event', self._on_press),
+                          canvas.mpl_connect('button_release_event', self._on_release),
+                          canvas.mpl_connect('draw_event', self._on_draw)]
+
+    def _set_blitting(self, value: bool) -> None:
+        """Start or stop blitting (the next full draw includes or saves a background without them)."""
+        self._blitting = value
+        self._background = None
+        for artist in self._animated:
+            artist.set_animated(value)
+        self.figure.canvas.draw_idle()
+
+    def _on_press(self, event: mpl.backend_bases.MouseEvent) -> None:
+        """Animate the moving elements when the knob is grabbed."""
+        if event.inaxes is self._widget_axis and event.button == 1:
+            self._set_blitting(True)
+
+    def _on_release(self, event: mpl.backend_bases.MouseEvent) -> None:
+        """Draw the moving elements with everything else again once the drag ends."""
+        if self._blitting:
+            self._set_blitting(False)
+
+    def _create_timer(self):
+        """Single-shot timer to apply the pending value to the UX elements."""
+
+        self._pending_value = None
+        self._timer = self.figure.canvas.new_timer(interval=UX_INTERVAL)
+        self._timer.single_shot = True
+        self._timer.add_callback(self._flush_ux)
+        # NOTE: the base class (e.g., non-interactive backends) never fires, so update right away
+        self._debounce = type(self._timer) is not mpl.backend_bases.TimerBase
+
+    @property
+    def region(self) -> Bbox:
+        """Area (display coordinates) re-drawn on updates, out to the figure edge for the value text."""
+        box = self._ux_axis.bbox
+        return Bbox.from_extents(box.x0, box.y0, self.figure.bbox.x1, box.y1)
+
+    def _on_draw(self, event: mpl.backend_bases.DrawEvent) -> None:
+        """Save the background (without the animated elements) and draw them over it."""
+        # NOTE: vector backends (e.g., savefig to PDF or SVG) cannot copy or blit
+        if not self._blitting or not getattr(event.canvas, 'supports_blit', False):
+            return
+        self._background = event.canvas.copy_from_bbox(self.region)
+        self.draw_animated()
+
+    def draw_animated(self) -> None:
+        """Draw each of the animated elements (e.g., after blitting something else under them)."""
+        for artist in self._animated:
+            if artist.get_animated():  # otherwise drawn with (and saved in) the background
+                artist.axes.draw_artist(artist)
+
     @property
     def pos(self) -> mpl.transforms.Bbox:
         """Return the BBox object for the underlying UX axis object."""
@@ -119,6 +198,11 @@ class Slider:
         """Set the slider manually."""
         self.widget.set_val(value_)
 
+    @property
+    def dragging(self) -> bool:
+        """True while the knob is being dragged with the mouse."""
+        return self.widget.drag_active
+
     def _ux_from_world(self, value: float) -> float:
         """Convert real value into UX slider value (which is padded, not 0-1)."""
 
@@ -133,6 +217,20 @@ class Slider:
         return s_loc
 
     def _update_ux(self, value: float) -> None:
+        """Hold `value` for the UX elements, only the last before the timer fires is drawn."""
+        armed = self._pending_value is not None
+        self._pending_value = value
+        if not self._debounce:
+            self._flush_ux()
+        elif not armed:
+            self._timer.start()
+
+    def _flush_ux(self) -> None:
+        """Move the UX elements to the pending value and draw them."""
+
+        value, self._pending_value = self._pending_value, None
+        if value is None:
+            return
 
         # ux value from world value
         s_loc = self._ux_from_world(value)
@@ -144,8 +242,13 @@ class Slider:
         # TODO: update value text with unit
         # self.widget.valtext.set_text(self.widget.valtext.get_text() + '  [{}]'.format(self.units))
 
-        # draw
-        self.figure.canvas.draw_idle()
+        # draw (the whole figure only if nothing has been saved to blit over)
+        if self._background is None:
+            self.figure.canvas.draw_idle()
+        else:
+            self.figure.canvas.restore_region(self._background)
+            self.draw_animated()
+            self.figure.canvas.blit(self.region)
 
     def on_changed(self, user_function: Callable[[float], None]) -> None:
         """Update underlying UX along with user defined function."""
@@ -158,5 +261,9 @@ class Slider:
 
     def remove(self) -> None:
         """Remove both axes."""
+        self._timer.stop()
+        self._pending_value = None
+        for cid in self._cids:
+            self.figure.canvas.mpl_disconnect(cid)
         self._ux_axis.remove()
         self._widget_axis.remove()
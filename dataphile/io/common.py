@@ -13,38 +13,64 @@
 """Common methods for I/O tasks."""
 
 # standard libs
-import re
+import os
 from typing import Union, Callable, IO
 from io import TextIOWrapper, BufferedReader
 import gzip, bz2, lzma, zipfile, tarfile
 
+# internal libs
+from .compression import _isal_level
+
+try:
+    from isal import igzip  # accelerated drop-in for `gzip`
+except ImportError:
+    igzip = None
+
 
 # IO for annotation, FileTypes for instance checking
 FileTypes = TextIOWrapper, BufferedReader
 
 
+def _gzip_open(filename: str, mode: str='rb', compresslevel: int=9, **options) -> IO:
+    """Same as `gzip.open` but uses ISA-L if available (levels are rescaled to 0-3)."""
+    if igzip is None:
+        return gzip.open(filename, mode, compresslevel, **options)
+    return igzip.open(filename, mode, _isal_level(compresslevel), **options)
+
+
 compression_formats = {
     'gzip': {
-        'pattern': '(?i)\.gz$',
-        'reader': gzip.open},
+        'pattern': r'(?i)\.gz$',
+        'suffixes': ('.gz', ),
+        'reader': _gzip_open},
     'bz2': {
-        'pattern': '(?i)\.bz(2)?$',
+        'pattern': r'(?i)\.bz(2)?$',
+        'suffixes': ('.bz', '.bz2'),
         'reader': bz2.open},
     'xz': {
-        'pattern': '(?i)\.(xz|lzma)$',
+        'pattern': r'(?i)\.(xz|lzma)$',
+        'suffixes': ('.xz', '.lzma'),
         'reader': lzma.open},
 }
 # aliases
 compression_formats['lzma'] = compression_formats['xz']
 compression_formats['bzip'] = compression_formats['bz2']
 
+# lower-case file extension -> compression name (aliases win, e.g., '.bz2' -> 'bzip')
+_compression_names = {suffix: name for name, spec in compression_formats.items()
+                      for suffix in spec['suffixes']}
+
+# lower-case file extension -> reader (the 'pattern' of each format only ever matches these)
+_compression_readers = {suffix: spec['reader'] for spec in compression_formats.values()
+                        for suffix in spec['suffixes']}
+
 
 archive_formats = {
     'zip': {
-        'pattern': '(?i)\.zip$',
+        'pattern': r'(?i)\.zip$',
         'reader': zipfile.ZipFile},
     'tar': {
-        'pattern': '(?i)\.tar$',
+        'pattern': r'(?i)\.tar$',
         'reader': tarfile.open},
 }
 
@@ -61,12 +87,7 @@ def select_reader(filepath: str) -> Callable[..., IO]:
        -------
        reader: Callable[..., IO]
     """
-    patterns = {x['pattern']: x['reader'] for x in compression_formats.values()}
-    for pattern, reader in patterns.items():
-        if re.search(pattern, filepath) is not None:
-            return reader
-    else:
-        return open  # default
+    return _compression_readers.get(os.path.splitext(filepath)[1].lower(), open)  # default is `open`
 
 
 def select_compression(filepath: str) -> str:
@@ -83,10 +104,5 @@ def select_compression(filepath: str) -> str:
        compression: str
            The propery compression format.
     """
-    patterns = {spec['pattern']: x for x, spec in compression_formats.items()}
-    for pattern, name in patterns.items():
-        if re.search(pattern, filepath) is not None:
-            return name
-    else:
-        return None  # default
+    return _compression_names.get(os.path.splitext(filepath)[1].lower(), None)
 
@@ -13,15 +13,59 @@
 """Incremental compression and decompression of data."""
 
 # standard libs
+import os
 import zlib
 import lzma
 import bz2
+import codecs
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Generator, Union, Dict, Any
 
 
+# drop-in replacements for `zlib` (same interface) with accelerated deflate.
+# the fastest available implementation is used by default for 'gzip'.
+CODECS = {'stdlib': zlib}
+try:
+    from isal import isal_zlib
+    CODECS['isal'] = isal_zlib
+except ImportError:
+    pass
+try:
+    from zlib_ng import zlib_ng
+    CODECS['zlib-ng'] = zlib_ng
+except ImportError:
+    pass
+
+DEFAULT_CODEC = [name for name in ('isal', 'zlib-ng', 'stdlib') if name in CODECS][0]
+
+
+def _check_codec(codec: str) -> None:
+    """Raise ValueError if `codec` is not available."""
+    if codec not in CODECS:
+        raise ValueError(f'"{codec}" is not an available codec. '
+                         f'Must be one of {tuple(CODECS.keys())}')
+
+
+def _isal_level(level: int) -> int:
+    """ISA-L only supports levels 0-3 (zlib's default of 6 maps to ISA-L's default of 2)."""
+    return min(level // 3, 3)
+
+
+def _gzip_compressobj(level: int=6, codec: str=DEFAULT_CODEC, **options) -> Any:
+    """Create deflate compressor using `codec`."""
+    if codec == 'isal':
+        level = _isal_level(level)
+    return CODECS[codec].compressobj(level, **options)
+
+
+def _gzip_decompressobj(*args, codec: str=DEFAULT_CODEC, **options) -> Any:
+    """Create deflate decompressor using `codec`."""
+    return CODECS[codec].decompressobj(*args, **options)
+
+
 COMPRESSORS = {
     'gzip': {
-        'init': zlib.compressobj,
+        'init': _gzip_compressobj,
         'args': [],
         'kwargs': {'method': zlib.DEFLATED, 'wbits': zlib.MAX_WBITS | 16, },
         'translation': {}},
@@ -34,13 +78,13 @@ COMPRESSORS = {
         'init': bz2.BZ2Compressor,
         'args': [],
         'kwargs': {},
-        'translation': {'level': 'compresslevel'}}
+        'translation': {}}
 }
 
 
 DECOMPRESSORS = {
     'gzip': {
-        'init': zlib.decompressobj,
+        'init': _gzip_decompressobj,
         'args': [zlib.MAX_WBITS | 32, ],
         'kwargs': {},
         'translation': {}},
@@ -82,25 +126,93 @@ def _init_compressor(spec: SpecType, **kwargs) -> CompressorType:
     compressor: CompressorType
         The instantiated compressor/decompressor (e.g., `lzma.LZMACompressor`).
     """
-    # NOTE: the "translation" mechanism was used for the "level" parameter.
-    # the level parameter is now actually passes as a first position argument.
+    # NOTE: the level parameter is passed as the first positional argument
+    # unless the "translation" names a keyword for it (e.g., 'preset' for lzma).
     level = kwargs.pop('level', None)
-    options = spec['kwargs']
+    options = dict(spec['kwargs'])
     for key, value in kwargs.items():
         if key in spec['translation']:
             options[spec['translation'][key]] = value
         else:
             options[key] = value
 
+    if level is not None and 'level' in spec['translation']:
+        options[spec['translation']['level']] = level
+        level = None
+
     args = [] if level is None else [level, ]
     return spec['init'](*spec['args'], *args, **options)
 
 
-def decompress(buffers: Iterable[BuffType], kind: str='gzip',
-               encoding: str=None) -> Generator[None, BuffType, None]:
+def _coalesce(buffers: Iterable[bytes], size: int) -> Generator[bytes, None, None]:
+    """Join consecutive `buffers` smaller than `size` bytes (larger buffers pass through as is)."""
+    pending = bytearray()
+    for buff in buffers:
+        if not pending and len(buff) >= size:
+            yield buff
+            continue
+        pending += buff
+        if len(pending) >= size:
+            yield bytes(pending)
+            pending.clear()
+    if pending:
+        yield bytes(pending)
+
+
+def _drain(decompressor: CompressorType, buff: bytes,
+           buffsize: int) -> Generator[bytes, None, bytes]:
+    """
+    Decompress all of `buff`, each output no larger than `buffsize`.
+    Returns any input following the end of the stream.
+    """
+    if hasattr(decompressor, 'unconsumed_tail'):
+        # NOTE: zlib-like decompressors hand back the input they have not yet consumed
+        while buff and not decompressor.eof:
+            yield decompressor.decompress(buff, buffsize)
+            buff = decompressor.unconsumed_tail
+    else:
+        # NOTE: lzma/bz2 decompressors hold on to the input internally
+        yield decompressor.decompress(buff, buffsize)
+        while not decompressor.needs_input and not decompressor.eof:
+            yield decompressor.decompress(b'', buffsize)
+    return decompressor.unused_data if decompressor.eof else b''
+
+
+def _iterdecompress(spec: SpecType, buffers: Iterable[bytes], buffsize: int,
+                    **options) -> Generator[None, bytes, None]:
+    """Decompress `buffers`, starting a new decompressor for each concatenated stream."""
+    decompressor = None
+    pending = b''  # start of a stream too short to begin with
+    for buff in buffers:
+        if pending:
+            buff, pending = pending + buff, b''
+        while buff:
+            if decompressor is None or decompressor.eof:
+                if decompressor is not None:
+                    buff = buff.lstrip(b'\x00')  # null padding between/after streams is skipped
+                    if not buff:
+                        break
+                if len(buff) < 2:
+                    # NOTE: ISA-L fails to detect gzip/zlib headers from a single byte
+                    pending = buff
+                    break
+                decompressor = _init_compressor(spec, **options)
+            buff = yield from _drain(decompressor, buff, buffsize)
+    if pending:
+        decompressor = _init_compressor(spec, **options)
+        yield from _drain(decompressor, pending, buffsize)
+    if decompressor is not None and hasattr(decompressor, 'flush'):
+        yield decompressor.flush()
+
+
+def decompress(buffers: Iterable[BuffType], kind: str='gzip', encoding: str=None,
+               codec: str=DEFAULT_CODEC, buffsize: int=1024**2,
+               chunk_bytes: int=1024**2) -> Generator[None, BuffType, None]:
     """
     Decompress a stream of raw buffers using a given compression.
 
+    Concatenated streams (e.g., multi-member gzip files) are decompressed in full.
+
     Arguments
     ---------
     buffers: Iterable[bytes]
@@ -112,30 +224,43 @@ def decompress(buffers: Iterable[BuffType], kind: str='gzip',
     encoding: str (default=None)
         Specification to use for decoding the decompressed buffers.
 
+    codec: str (default=DEFAULT_CODEC)
+        Implementation of deflate to use for 'gzip' (e.g., 'isal', 'zlib-ng', 'stdlib').
+
+    buffsize: int (default=1024**2)
+        Maximum size (in bytes) of each decompressed buffer.
+
+    chunk_bytes: int (default=1024**2)
+        Smaller input buffers are joined up to this size before decompressing (0 to disable).
+
     Yields
     ------
     data: str
-        A decompressed and decoded string for every input buffer.
+        A decompressed and decoded string, at most `buffsize` bytes before decoding.
     """
-    def decode(data: bytes) -> str:
-        return data.decode(encoding)
-    try:
-        decompressor = _init_compressor(DECOMPRESSORS[kind])
-        if encoding is not None:
-            yield from map(decode, map(decompressor.decompress, buffers))
-            if hasattr(decompressor, 'flush'):
-                yield decompressor.flush()
-        else:
-            yield from map(decompressor.decompress, buffers)
-            if hasattr(decompressor, 'flush'):
-                yield decompressor.flush()
-    except KeyError:
+    _check_codec(codec)
+    if kind not in DECOMPRESSORS:
         raise KeyError(f'"{kind}" is not a valid compression scheme. '
-                       f'Must be one of {COMPRESSORS.keys()}')
+                       f'Must be one of {DECOMPRESSORS.keys()}')
+
+    options = {'codec': codec} if kind == 'gzip' else {}
+    if chunk_bytes:
+        buffers = _coalesce(buffers, chunk_bytes)
+    data = _iterdecompress(DECOMPRESSORS[kind], buffers, buffsize, **options)
+    if encoding is None:
+        yield from filter(None, data)
+    else:
+        # NOTE: multi-byte characters may be split across buffers
+        decoder = codecs.getincrementaldecoder(encoding)()
+        yield from filter(None, map(decoder.decode, data))
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
 
 
 def compress(buffers: Iterable[str], kind: str='gzip', encoding: str=None,
-             level: int=6) -> Generator[None, bytes, None]:
+             level: int=6, codec: str=DEFAULT_CODEC,
+             chunk_bytes: int=1024**2) -> Generator[None, bytes, None]:
     """
     Compress a stream of strings using a given compression.
 
@@ -153,21 +278,59 @@ def compress(buffers: Iterable[str], kind: str='gzip', encoding: str=None,
     level: int (default=6)
         Compression level to use on data.
 
+    codec: str (default=DEFAULT_CODEC)
+        Implementation of deflate to use for 'gzip' (e.g., 'isal', 'zlib-ng', 'stdlib').
+        Levels are rescaled for 'isal', which only supports levels 0-3.
+
+    chunk_bytes: int (default=1024**2)
+        Smaller (encoded) buffers are joined up to this size before compressing (0 to disable).
+        Fewer, larger calls into the compressor are faster for many small buffers.
+
     Yields
     ------
     data: bytes
-        An encoded and compressed bytes object for every input string.
+        An encoded and compressed bytes object for every (joined) input buffer.
     """
     def encode(data: str) -> bytes:
         return data.encode(encoding)
+    _check_codec(codec)
+    options = {'codec': codec} if kind == 'gzip' else {}
     try:
-        compressor = _init_compressor(COMPRESSORS[kind])
-        if encoding is None:
-            yield from map(compressor.compress, buffers)
-            yield compressor.flush()
-        else:
-            yield from map(compressor.compress, map(encode, buffers))
-            yield compressor.flush()
+        compressor = _init_compressor(COMPRESSORS[kind], level=level, **options)
+        if encoding is not None:
+            buffers = map(encode, buffers)
+        if chunk_bytes:
+            buffers = _coalesce(buffers, chunk_bytes)
+        yield from map(compressor.compress, buffers)
+        yield compressor.flush()
     except KeyError:
         raise KeyError(f'"{kind}" is not a valid compression scheme. '
                        f'Must be one of {COMPRESSORS.keys()}')
+
+
+def compress_many(streams: Dict[str, Iterable[BuffType]], workers: int=None,
+                  **options: Any) -> Dict[str, bytes]:
+    """
+    Compress several independent streams at once on a pool of threads.
+    The compressors release the GIL, so independent streams scale with the number of cores.
+
+    Arguments
+    ---------
+    streams: Dict[str, Iterable[BuffType]]
+        Buffers for each named stream (e.g., a column or file name).
+
+    workers: int (default=None)
+        Number of threads (at most one per stream). Default is the number of cores.
+
+    **options: Any
+        Named parameters passed to `compress` (e.g., kind='lzma', level=9).
+
+    Returns
+    -------
+    compressed: Dict[str, bytes]
+        The complete compressed data for each of the named `streams`.
+    """
+    workers = min(workers or os.cpu_count() or 1, max(1, len(streams)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda buffers: b''.join(compress(buffers, **options)), streams.values())
+        return dict(zip(streams.keys(), results))
@@ -27,7 +27,11 @@ from h5py import File, Dataset, Group
 # with an alternative of the same bit-depth and then annotated with the real dtype.
 __special_dtypes__ = {'datetime64[ns]': 'uint64',
                       '<M8[ns]': 'uint64',  # also datetime
-                      '<U\d+': 'uint8'}
+                      r'<U\d+': 'uint8'}
+
+# compiled once, with the original pattern (also compared literally)
+_special_dtypes = tuple((_re.compile(pattern), pattern, replacement)
+                        for pattern, replacement in __special_dtypes__.items())
 
 
 def _abspath(group: str, dataset: str) -> str:
@@ -37,10 +41,10 @@ def _abspath(group: str, dataset: str) -> str:
 
 def _get(dataset: str, open_file: File) -> _np.ndarray:
     """Read values from HDF5 file, check for `dtype` attribute."""
-    if 'dtype' not in open_file[dataset].attrs:
-        return open_file[dataset].value
-    else:
-        return open_file[dataset].value.view(open_file[dataset].attrs['dtype'])
+    node = open_file[dataset]
+    array = node[()]  # NOTE: read straight into a new array (`.value` was removed in h5py 3)
+    dtype = node.attrs.get('dtype')
+    return array if dtype is None else array.view(dtype)
 
 
 def read(filename: str, group: str='/') -> _Dict[str, _np.ndarray]:
@@ -82,28 +86,47 @@ def read_table(filename: str, group: str = '/') -> _pd.DataFrame:
     return _pd.DataFrame(read(filename, group))
 
 
-def _put(array: _np.ndarray, dest: str, open_file: File) -> None:
+def _create(dest: str, data: _np.ndarray, open_file: File, compression: str=None) -> None:
+    """Create dataset, chunked and compressed unless `compression` is None (or nothing to chunk)."""
+    data = _np.asarray(data)
+    if compression is None or data.ndim == 0 or data.size == 0:
+        open_file[dest] = data
+    else:
+        # NOTE: shuffle groups bytes of equal significance together (much better for numbers)
+        open_file.create_dataset(dest, data=data, chunks=True, compression=compression, shuffle=True)
+
+
+def _put(array: _np.ndarray, dest: str, open_file: File, compression: str=None) -> None:
     """Insert array into HDF5 file."""
     if dest in open_file:
         del open_file[dest]  # we have to clear this or we'll get an error
+    if array.dtype.kind in 'biufc':
+        # all numerical types (nothing special to check)
+        _create(dest, array, open_file, compression)
+        return
     typename = str(array.dtype)
-    for pattern, replacement in __special_dtypes__.items():
-        if _re.match(pattern, typename) or typename == pattern:
-            open_file[dest] = _np.array(array, dtype=typename).view(replacement)
+    for regex, pattern, replacement in _special_dtypes:
+        if regex.match(typename) or typename == pattern:
+            _create(dest, _np.array(array, dtype=typename).view(replacement), open_file, compression)
             open_file[dest].attrs['dtype'] = typename
             return
-    if typename == 'object':
-        # pandas replaces (e.g.) '<U12' with 'object'
-        # we can try to coerce this back into '<U\d+' notation
-        alt_typename = '<U{}'.format(max(map(lambda s: len(s), array)))
-        open_file[dest] = _np.array(array, dtype=alt_typename).view('uint8')  # like chars
-        open_file[dest].attrs['dtype'] = alt_typename
+    if typename in ('object', 'string', 'str'):
+        # pandas replaces (e.g.) '<U12' with 'object' (or its own string dtype)
+        # we can try to coerce this back into '<U\d+' notation (numpy finds the width)
+        values = _np.asarray(array, dtype=object)
+        if not all(isinstance(value, str) for value in values.flat):
+            # NOTE: numpy would silently store missing values as 'None' or 'nan'
+            raise TypeError('cannot write "{}", all values must be strings (missing values are not '
+                            'supported)'.format(dest))
+        chars = values.astype(_np.str_)
+        _create(dest, chars.view('uint8'), open_file, compression)  # like chars
+        open_file[dest].attrs['dtype'] = chars.dtype.str
     else:
-        # all numerical types
-        open_file[dest] = array
+        # anything else h5py can store as is
+        _create(dest, array, open_file, compression)
 
 
-def write(filename: str, group: str='/', **datasets: _np.ndarray) -> None:
+def write(filename: str, group: str='/', *, compression: str='gzip', **datasets: _np.ndarray) -> None:
     """Write out named 'datasets' to HDF5 file under specified 'group'.
 
        Parameters
@@ -114,6 +137,11 @@ def write(filename: str, group: str='/', **datasets: _np.ndarray) -> None:
        group: str (default='/')
            Group or subgroup to output datasets to within the file.
 
+       compression: str (default='gzip')
+           Filter for chunked datasets (keyword only). The default can be read by any
+           HDF5 library ('lzf' is faster but only available with h5py).
+           If None, datasets are written contiguous and uncompressed.
+
         **datasets: `numpy.ndarray`
             n-dim array data to write under 'group'.
 
@@ -121,7 +149,15 @@ def write(filename: str, group: str='/', **datasets: _np.ndarray) -> None:
         -------
         None
     """
-    with File(filename) as outfile:
+    if compression is not None and not isinstance(compression, (str, int)):  # or a filter id
+        raise TypeError('write expects `compression` to be the name of a filter or None, given {}. '
+                        '(a dataset cannot be named "compression")'.format(type(compression)))
+    _write(filename, group, datasets, compression)
+
+
+def _write(filename: str, group: str, datasets: _Dict[str, _np.ndarray], compression: str) -> None:
+    """Write `datasets` (by name) to `filename` under `group` (see `write`)."""
+    with File(filename, mode='a') as outfile:
         if group not in outfile:
             outfile.create_group(group)
         else:
@@ -131,10 +167,10 @@ def write(filename: str, group: str='/', **datasets: _np.ndarray) -> None:
                 raise UserWarning('"{group}" has existing datasets not included here. ({names})'
                                   .format(group=group, names=current_datasets - set(datasets.keys())))
         for name, array in datasets.items():
-            _put(array, _abspath(group, name), outfile)
+            _put(array, _abspath(group, name), outfile, compression)
 
 
-def write_table(df: _pd.DataFrame, filename: str, group: str='/') -> None:
+def write_table(df: _pd.DataFrame, filename: str, group: str='/', *, compression: str='gzip') -> None:
     """Write each `pandas.Series` within 'df' to dataset in HDF5 file under specified 'group'.
 
        Parameters
@@ -148,6 +184,9 @@ def write_table(df: _pd.DataFrame, filename: str, group: str='/') -> None:
        group: str (default='/')
            Group or subgroup to output datasets to within the file.
 
+       compression: str (default='gzip')
+           See `write`.
+
         Returns
         -------
         None
@@ -155,4 +194,4 @@ def write_table(df: _pd.DataFrame, filename: str, group: str='/') -> None:
     datasets = {name: df[name] for name in df.columns}
     if df.index.name is not None:
         datasets[df.index.name] = df.index  # non-trivial indices are saved
-    write(filename, group, **datasets)
+    _write(filename, group, datasets, compression)
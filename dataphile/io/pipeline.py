@@ -0,0 +1,117 @@
+# This file is part of the Dataphile package.
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the Apache License (v2.0) as published by the Apache Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the Apache License for more details.
+#
+# You should have received a copy of the Apache License along with this program.
+# If not, see <https://www.apache.org/licenses/LICENSE-2.0>.
+
+"""Overlap the stages of a data pipeline using background threads."""
+
+# standard libs
+import queue
+import threading
+from typing import Any, Iterable, Iterator, Generator
+
+
+# marks the end of the data on the queue
+_DONE = object()
+
+
+class _Error:
+    """Wraps an exception raised by the producer to be re-raised by the consumer."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+class Prefetch:
+    """
+    Iterate over `iterable` on a background thread.
+
+    The thread starts immediately and stays at most `depth` items
+    ahead of the consumer (e.g., with depth=2 the next buffer is read
+    while the current one is being processed). Exceptions raised by
+    the `iterable` are re-raised when iterating.
+
+    Example
+    -------
+    >>> for buff in Prefetch(stream.iterbuffers(buffsize)):
+    ...     writer.write(buff)
+    """
+
+    def __init__(self, iterable: Iterable[Any], depth: int=2) -> None:
+        """
+        Initialize and start the background thread.
+
+        Arguments
+        ---------
+        iterable: Iterable[Any]
+            Source of items (e.g., `BinaryStream.iterbuffers`).
+
+        depth: int (default=2)
+            Maximum number of items held ahead of the consumer.
+        """
+        self.depth = depth
+        self._queue = queue.Queue(self.depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, args=(iterable, ), daemon=True)
+        self._thread.start()
+
+    @property
+    def depth(self) -> int:
+        """Maximum number of items held ahead of the consumer."""
+        return self._depth
+
+    @depth.setter
+    def depth(self, value: int) -> None:
+        """Validate and assign depth."""
+        if not isinstance(value, int):
+            raise TypeError(f'{self.__class__.__qualname__}.depth expects {int}, given {type(value)}.')
+        if value < 1:
+            raise ValueError(f'{self.__class__.__qualname__}.depth must be at least 1, given {value}.')
+        self._depth = value
+
+    def _put(self, item: Any) -> bool:
+        """Put `item` on the queue unless the consumer stops first."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(self, iterable: Iterable[Any]) -> None:
+        """Exhaust `iterable` onto the queue."""
+        try:
+            for item in iterable:
+                if not self._put(item):
+                    return
+        except Exception as error:
+            self._put(_Error(error))
+        else:
+            self._put(_DONE)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield items from the queue."""
+        try:
+            for item in iter(self._queue.get, _DONE):
+                if isinstance(item, _Error):
+                    raise item.error
+                yield item
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Signal the background thread to stop producing."""
+        self._stop.set()
+
+
+def prefetch(iterable: Iterable[Any], depth: int=2) -> Generator[None, Any, None]:
+    """Iterate over `iterable` on a background thread (see `Prefetch`)."""
+    yield from Prefetch(iterable, depth=depth)
@@ -17,7 +17,9 @@
 import os
 import sys
 import time
+import mmap
 import functools
+import weakref
 import itertools
 from typing import Any, List, IO, Union, Generator, Iterable
 from abc import ABC as AbstractBase, abstractproperty
@@ -26,6 +28,30 @@ from abc import ABC as AbstractBase, abstractproperty
 # used to represent both buffer types.
 BuffType = Union[bytes, str]
 
+
+def page_align(buffsize: int) -> int:
+    """Round `buffsize` (in bytes) up to a whole number of memory pages."""
+    return max(1, -(-buffsize // mmap.PAGESIZE)) * mmap.PAGESIZE
+
+
+def _advise_sequential(file: IO) -> IO:
+    """Tell the kernel `file` will be read once from start to end (where supported)."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            fd = file.fileno()
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)  # larger read-ahead
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
+        except OSError:
+            pass  # only advice (e.g., not possible for pipes)
+    return file
+
+
+def _close_all(handles: List[IO]) -> None:
+    """Close each of `handles` (called by a finalizer, so must not refer to the stream)."""
+    for handle in handles:
+        handle.close()
+
+
 class BaseStream(AbstractBase):
     """
     Generic Stream base class.
@@ -49,6 +75,7 @@ class BaseStream(AbstractBase):
         """
 
         self._active = None  # must be before self.sources assignment
+        self._finalizer = None  # closes the active IO only if we opened it
         self.options = options  # must before self.sources assignment
         self.sources = sources
 
@@ -107,10 +134,10 @@ class BaseStream(AbstractBase):
         if not isinstance(other, str):
             raise ValueError(f'{self.__class__.__qualname__}.active expects a <str> (file path), '
                              f'given {other}({type(other)}).')
-        next_active = open(other, mode=self._mode, **self.options)
-        if self._active is not None and self._active is not self._default_source:
-            self._active.close()
+        next_active = _advise_sequential(open(other, mode=self._mode, **self.options))
+        self.close()
         self._active = next_active
+        self._finalizer = weakref.finalize(self, next_active.close)
 
     def _next_active(self) -> None:
         """Cycle the active source."""
@@ -129,19 +156,38 @@ class BaseStream(AbstractBase):
         else:
             return buff
 
+    def readinto(self, buffer: bytearray) -> int:
+        """
+        Read bytes from currently active IO into a pre-allocated `buffer`.
+        Only binary streams support this. Returns number of bytes read (0 when exhausted).
+        """
+        size = self.active.readinto(buffer)
+        if not size:
+            try:
+                self._next_active()
+                return self.readinto(buffer)
+            except IndexError:
+                return 0
+        else:
+            return size
+
     def iterbuffers(self, buffsize: int) -> Generator[str, BuffType, None]:
         """Yield buffers of size 'buffsize'."""
         yield from iter(functools.partial(self.read, buffsize),
                         self._sentinel)
 
-    def __del__(self) -> None:
-        """Ensure the active IO is closed."""
-        if self.active is not None and self.active is not self._default_source:
-            self._active.close()
+    def close(self) -> None:
+        """
+        Close any IO opened by the stream.
+        The default source (stdin) is never closed. This also happens
+        when the stream is garbage collected or at interpreter exit.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
 
     def __exit__(self, *errs) -> None:
         """Context manager exit."""
-        self.__del__()
+        self.close()
 
     def __enter__(self) -> 'BaseStream':
         """Context manager enter."""
@@ -213,9 +259,11 @@ class LiveStream(BaseStream):
 
         if not sources:
             self._handles = itertools.cycle([self._default_source])
+            self._finalizer = None
         else:
-            self._handles = itertools.cycle([open(source, mode=self._mode, **options)
-                                             for source in sources])
+            handles = [_advise_sequential(open(source, mode=self._mode, **options)) for source in sources]
+            self._handles = itertools.cycle(handles)
+            self._finalizer = weakref.finalize(self, _close_all, handles)
         self._active = next(self.handles)
 
     @property
@@ -267,13 +315,15 @@ class LiveStream(BaseStream):
         else:
             return buff
 
-    def __del__(self) -> None:
-        """Close all file handles."""
-        if self.sources:
-            for i, handle in enumerate(self.handles):
-                handle.close()
-                if i > len(self.sources):
-                    break  # would never exit otherwise
+    def readinto(self, buffer: bytearray) -> int:
+        """Read from active handle into a pre-allocated `buffer` (binary streams only)."""
+        size = self.active.readinto(buffer)
+        if not size:
+            self._active = next(self.handles)
+            time.sleep(self.latency)
+            return self.readinto(buffer)
+        else:
+            return size
 
 
 class LiveBinaryStream(LiveStream):
@@ -24,9 +24,15 @@ def polynomial1D(x: np.ndarray, *p: Number) -> np.ndarray:
     """A one dimensional polynomial function.
 
        The order of the polynomial is dynamic and dependent upon the number
-       of input arguments, 'p'.
+       of input arguments, 'p'. It is evaluated by Horner's method, p_0 + x*(p_1 + x*(p_2 + ...)),
+       in place on a single array (no powers of 'x' are computed). The result has the type
+       of 'x' and 'p' together (e.g., integers stay integers, float32 samples stay float32).
     """
-    return sum(p_i * x**i for i, p_i in enumerate(p))
+    y = np.zeros(np.shape(x), dtype=np.result_type(x, *p))
+    for p_i in reversed(p):
+        y *= x
+        y += p_i
+    return y[()]  # scalar in, scalar out
 
 
 def linear1D(x: np.ndarray, intercept: Number, slope: Number) -> np.ndarray:
@@ -79,10 +85,13 @@ def blackbody(x: np.ndarray, T: Quantity) -> Quantity:
 
     # planck's, speed of light, and Boltzmann constants
     from astropy.constants import h, c, k_B
+    h, c, k_B = h.si.value, c.si.value, k_B.si.value
 
+    # NOTE: arithmetic on Quantity objects is slow, units are attached once at the end
+    x, T = x.to_value(u.m), T.to_value(u.K)
     A = 2 * h * c**2 / x**5
-    B = np.exp((h * c / (x * k_B * T)).decompose()) - 1
-    return (A / B).to('kW m^-2 nm-1') / u.sr
+    B = np.expm1(h * c / (x * k_B * T))  # more accurate than exp(...) - 1 at long wavelengths
+    return (A / B * u.Unit('W m^-2 m^-1')).to('kW m^-2 nm-1') / u.sr
 
 
 def normalized_voigt1D(x: np.ndarray, x0: Number, sigma: Number, gamma: Number) -> np.ndarray:
@@ -15,6 +15,7 @@
 from typing import List, Tuple, Dict, Callable, Any, Union
 from numbers import Number
 import itertools
+from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
@@ -24,6 +25,7 @@ from scipy.optimize import curve_fit
 import matplotlib as mpl
 import matplotlib.figure
 import matplotlib.lines
+import matplotlib.backend_bases
 from matplotlib import widgets
 from matplotlib import pyplot as plot
 
@@ -385,6 +387,17 @@ class CompositeModel(Model):
                     for loc, model in zip(self.__index_pairs, self.models)])
 
 
+# component curves kept (per graph) for parameter values seen before
+MODEL_CACHE_SIZE = 128
+
+# while a slider is dragged, graphs with more samples than this are drawn with every n-th sample
+DRAG_MIN_SAMPLES = 1000
+DRAG_DECIMATION = 4
+
+# slider events arriving faster than this (milliseconds) are combined into a single re-draw
+REDRAW_INTERVAL = 33
+
+
 class AutoGUI:
     """Automatically generate a graphical interface for manipulating model parameters."""
     # TODO: simple example in __doc__ string.
@@ -392,7 +405,7 @@ class AutoGUI:
     def __init__(self, model: Model, graphs: List[mpl.lines.Line2D]=None, figure: mpl.figure.Figure=None,
                  bbox: List[float]=[0, 0, 1, 1], background: Union[bool,str]=None, border: bool=False,
                  radio_options: Dict[str, Any]=None, slider_options: Dict[str, Any]=None,
-                 data: Tuple[np.ndarray, np.ndarray]=None):
+                 data: Tuple[np.ndarray, np.ndarray]=None, blit: bool=True):
         """Initialize elements of the GUI.
 
            Arguments
@@ -421,6 +434,10 @@ class AutoGUI:
            data: Tuple[np.ndarray, np.ndarray] (default=None)
                If provided with (xdata, ydata), create a 'Fit' button and optimize the provided
                data with the current model parameter values as initial guess.
+           blit: bool (default=True)
+               If True (and supported by the backend), only the graphs are re-drawn while a
+               slider is dragged, over a saved copy of the rest of their axes. The graphs are
+               only "animated" artists during the drag, otherwise the whole figure is drawn.
         """
 
         # initialize attributes
@@ -433,12 +450,40 @@ class AutoGUI:
         self.radio_options = radio_options
         self.slider_options = slider_options
         self.data = data
+        self.blit = blit
 
         # access modes
         self.__models_by_label = {model.label: model for model in self.models}
         self.__models_by_index = {i: model for i, model in enumerate(self.models)}
         self.__index_by_models = {model.label: i for i, model in enumerate(self.models)}
 
+        # evaluated component curves for each graph (see __evaluate)
+        self.__cache = dict()
+
+        # full and reduced (used while dragging) samples for each graph
+        self.__samples = list()
+        for graph in self.graphs:
+            xdata = graph.get_xdata()
+            step = DRAG_DECIMATION if len(xdata) > DRAG_MIN_SAMPLES else 1
+            self.__samples.append((xdata, xdata[::step]))
+        self.__decimated = False
+        self.figure.canvas.mpl_connect('button_press_event', self.__on_press)
+        self.figure.canvas.mpl_connect('button_release_event', self.__on_release)
+
+        # NOTE: canvases without an event loop (e.g., Agg) have timers that never fire
+        self.__pending = False
+        self.__timer = self.figure.canvas.new_timer(interval=REDRAW_INTERVAL)
+        self.__timer.single_shot = True
+        self.__timer.add_callback(self.__flush)
+        self.__debounce = type(self.__timer) is not mpl.backend_bases.TimerBase
+
+        # saved axes backgrounds (without the graphs) for blitting, taken while dragging
+        self.__blitting = False
+        self.__backgrounds = dict()
+        if self.blit is True:
+            for canvas in {graph.figure.canvas for graph in self.graphs}:
+                canvas.mpl_connect('draw_event', self.__on_draw)
+
         # create axis if border is requested
         if self.border is True:
             self.__create_background()
@@ -561,6 +606,20 @@ class AutoGUI:
         else:
             self.__border = val
 
+    @property
+    def blit(self) -> bool:
+        """True/False - only re-draw graphs (over saved backgrounds) when sliders move."""
+        return self.__blit
+
+    @blit.setter
+    def blit(self, val: bool) -> None:
+        """Assign True/False - only re-draw graphs when sliders move."""
+        if not isinstance(val, bool):
+            raise TypeError('{0}.blit expects True or False, given {1}.'
+                            .format(self.__class__.__name__, val))
+        else:
+            self.__blit = val and all(graph.figure.canvas.supports_blit for graph in self.graphs)
+
     @property
     def background(self) -> str:
         """Whether to use filled background behind widget elements.
@@ -705,14 +764,18 @@ class AutoGUI:
         options = dict()
         options.update(self.slider_options)
         self.__remove_sliders() # remove old sliders
+
+        # looked up once, not for every slider
+        top = y0 + self.bbox[3]
+        figure, sliders, update = self.figure, self.sliders, self.__slider_update_function
         for count, parameter in enumerate(model.parameters):
 
-            slider = Slider(figure=self.figure,
-                            location=[x0, y0 + self.bbox[3] - (1 + count)*height, width, height],
+            slider = Slider(figure=figure,
+                            location=[x0, top - (1 + count)*height, width, height],
                             label=parameter.label, bounds=parameter.bounds, init_value=parameter.value,
                             **options)
-            slider.on_changed(self.__slider_update_function)
-            self.sliders.append(slider)
+            slider.on_changed(update)
+            sliders.append(slider)
 
     def __remove_sliders(self) -> None:
         """Remove sliders from view."""
@@ -727,13 +790,99 @@ class AutoGUI:
         for slider, parameter in zip(self.sliders, self.active_model.parameters):
             parameter.value = slider.value
 
-        self.__update_graph()
-
-    def __update_graph(self) -> None:
-        """Re-draw curves based on current slider values."""
+        # re-draw once the events stop coming in (or every REDRAW_INTERVAL while dragging)
+        if not self.__debounce:
+            self.__flush()
+        elif not self.__pending:
+            self.__pending = True
+            self.__timer.start()
+
+    def __flush(self) -> None:
+        """Re-draw graphs for the latest parameter values."""
+        self.__pending = False
+        self.__update_graph(decimate=any(slider.dragging for slider in self.sliders))
+
+    def __on_press(self, event: mpl.backend_bases.MouseEvent) -> None:
+        """Start blitting the graphs when a slider is grabbed (the next full draw saves backgrounds)."""
+        if self.blit is True and event.button == 1 and any(event.inaxes is slider.widget.ax
+                                                          for slider in self.sliders):
+            self.__blitting = True
+            for graph in self.graphs:
+                graph.set_animated(True)
+            for canvas in {graph.figure.canvas for graph in self.graphs}:
+                canvas.draw_idle()
+
+    def __on_release(self, event: mpl.backend_bases.MouseEvent) -> None:
+        """Stop blitting and re-draw at full resolution when a drag ends."""
+        blitting, self.__blitting = self.__blitting, False
+        if blitting:
+            self.__backgrounds.clear()  # the graphs are drawn with everything else again
+            for graph in self.graphs:
+                graph.set_animated(False)
+        if self.__decimated and not self.__pending:
+            self.__update_graph()
+        elif blitting:
+            for canvas in {graph.figure.canvas for graph in self.graphs}:
+                canvas.draw_idle()
+
+    def __evaluate(self, index: Tuple[int, bool], xdata: np.ndarray) -> np.ndarray:
+        """Evaluate the model over `xdata`, only solving components whose values changed.
+           The `index` identifies the graph (and set of samples) the curves are kept for.
+
+           Component curves are kept (least recently used are dropped) keyed by their parameter
+           values, so moving a slider only re-solves the active model and dragging back and forth
+           re-uses earlier results.
+        """
+        cached_xdata, cache = self.__cache.get(index, (None, None))
+        if cached_xdata is not xdata:
+            cache = OrderedDict()
+            self.__cache[index] = xdata, cache  # new samples, nothing can be re-used
+
+        components = list()
+        for i, model in enumerate(self.models):
+            key = i, tuple(model.values)
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                cache[key] = model.solve(xdata)
+                if len(cache) > MODEL_CACHE_SIZE:
+                    cache.popitem(last=False)
+            components.append(cache[key])
+
+        return sum(components)
+
+    def __on_draw(self, event: mpl.backend_bases.DrawEvent) -> None:
+        """Save backgrounds once the canvas is fully drawn, then draw the (animated) graphs."""
+        # NOTE: vector backends (e.g., savefig to PDF or SVG) cannot copy or blit
+        if not self.__blitting or not getattr(event.canvas, 'supports_blit', False):
+            return
+        for axes in {graph.axes for graph in self.graphs if graph.figure.canvas is event.canvas}:
+            self.__backgrounds[axes] = event.canvas.copy_from_bbox(axes.bbox)
         for graph in self.graphs:
-            graph.set_ydata(self.model(graph.get_xdata()))
-            graph.figure.canvas.draw_idle()
+            if graph.figure.canvas is event.canvas:
+                graph.axes.draw_artist(graph)
+
+    def __update_graph(self, decimate: bool=False) -> None:
+        """Re-draw curves based on current slider values (with fewer samples if `decimate`)."""
+        for index, (graph, samples) in enumerate(zip(self.graphs, self.__samples)):
+            xdata = samples[decimate]
+            graph.set_data(xdata, self.__evaluate((index, decimate), xdata))
+        self.__decimated = decimate
+
+        # NOTE: without a saved background (e.g., not drawn yet) fall back to a full draw
+        for axes in {graph.axes for graph in self.graphs}:
+            canvas = axes.figure.canvas
+            if axes in self.__backgrounds:
+                canvas.restore_region(self.__backgrounds[axes])
+                for graph in self.graphs:
+                    if graph.axes is axes:
+                        axes.draw_artist(graph)
+                for slider in self.sliders:
+                    if slider.figure is axes.figure and slider.region.overlaps(axes.bbox):
+                        slider.draw_animated()  # sliders placed over the axes were just covered
+                canvas.blit(axes.bbox)
+            else:
+                canvas.draw_idle()
 
     def __abs_pos(self, x: float, y: float) -> List[float]:
         """Helper function returns absolute x and/or y values (percent) given relative values."""
@@ -0,0 +1,51 @@
+# This file is part of the Dataphile package.
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the Apache License (v2.0) as published by the Apache Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the Apache License for more details.
+#
+# You should have received a copy of the Apache License along with this program.
+# If not, see <https://www.apache.org/licenses/LICENSE-2.0>.
+
+"""Tests for common I/O methods."""
+
+# standard libs
+import re
+import bz2
+import lzma
+
+# external libs
+import pytest
+
+# internal libs
+from dataphile.io.common import select_reader, select_compression, compression_formats, _gzip_open
+
+
+@pytest.mark.parametrize('filepath, compression, reader', [
+    ('data.csv.gz', 'gzip', _gzip_open),
+    ('/some/path/DATA.GZ', 'gzip', _gzip_open),
+    ('data.bz', 'bzip', bz2.open),
+    ('data.csv.Bz2', 'bzip', bz2.open),
+    ('data.xz', 'lzma', lzma.open),
+    ('data.LZMA', 'lzma', lzma.open),
+    ('data.csv', None, open),
+    ('data', None, open),
+    ('data.gz.csv', None, open),
+    ('archive.gz/data', None, open),
+    ('data.tgz', None, open),
+])
+def test_select(filepath, compression, reader):
+    """Readers and compression names are found by the (case-insensitive) extension only."""
+    assert select_compression(filepath) == compression
+    assert select_reader(filepath) is reader
+
+
+@pytest.mark.parametrize('filepath', ['a.gz', 'b.GZ', 'c.bz', 'd.bz2', 'e.xz', 'f.lzma', 'g.csv', 'h.tgz'])
+def test_select_matches_patterns(filepath):
+    """The lookup gives the same reader as the first matching 'pattern' of each format."""
+    expected = next((spec['reader'] for spec in compression_formats.values()
+                     if re.search(spec['pattern'], filepath)), open)
+    assert select_reader(filepath) is expected
@@ -0,0 +1,119 @@
+# This file is part of the Dataphile package.
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the Apache License (v2.0) as published by the Apache Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the Apache License for more details.
+#
+# You should have received a copy of the Apache License along with this program.
+# If not, see <https://www.apache.org/licenses/LICENSE-2.0>.
+
+"""Tests for incremental compression and decompression."""
+
+# standard libs
+import gzip
+import bz2
+import lzma
+
+# external libs
+import pytest
+
+# internal libs
+from dataphile.io.compression import compress, decompress, compress_many, _coalesce, CODECS
+
+
+KINDS = {'gzip': gzip.compress, 'bzip': bz2.compress, 'lzma': lzma.compress}
+DATA = b''.join(b'%d,%d,%f\n' % (i, i % 7, i / 3) for i in range(20000))
+
+
+def split(data, size):
+    """Cut `data` into buffers of `size` bytes."""
+    return [data[i:i+size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('size', [1, 7, 1024, 10**6])
+def test_decompress(kind, size):
+    """Input cut at any boundary decompresses the same (with or without joining buffers)."""
+    buffers = split(KINDS[kind](DATA), size)
+    assert b''.join(decompress(buffers, kind, chunk_bytes=0)) == DATA
+    if size >= 1024:  # joining tiny buffers is tested for speed elsewhere
+        assert b''.join(decompress(buffers, kind)) == DATA
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_decompress_multistream(kind):
+    """Concatenated streams (e.g., multi-member gzip files) are decompressed in full."""
+    members = [DATA[:1000], DATA[1000:50000], b'', DATA[50000:]]
+    stream = b''.join(map(KINDS[kind], members))
+    for size in (13, len(stream)):
+        assert b''.join(decompress(split(stream, size), kind, chunk_bytes=0)) == DATA
+
+
+def test_decompress_null_padding():
+    """Null bytes between or after gzip members are skipped (e.g., tape block padding)."""
+    first, second = gzip.compress(DATA[:5000]), gzip.compress(DATA[5000:])
+    stream = first + b'\x00' * 100 + second + b'\x00' * 1000
+    for size in (1, 64, len(stream)):
+        assert b''.join(decompress(split(stream, size), chunk_bytes=0)) == DATA
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_decompress_buffsize(kind):
+    """Highly compressed input is drained in outputs of at most `buffsize` bytes."""
+    data = b'x' * 10**7
+    output = list(decompress([KINDS[kind](data)], kind, buffsize=4096))
+    assert all(len(buff) <= 4096 for buff in output)
+    assert b''.join(output) == data
+
+
+def test_decompress_encoding():
+    """Multi-byte characters split across buffers are decoded whole."""
+    text = 'αβγδε ' * 10000
+    buffers = split(gzip.compress(text.encode('utf-8')), 3)
+    assert ''.join(decompress(buffers, encoding='utf-8', buffsize=7, chunk_bytes=0)) == text
+
+
+def test_decompress_invalid():
+    """Unknown schemes are rejected."""
+    with pytest.raises(KeyError):
+        list(decompress([b''], kind='zip'))
+    with pytest.raises(ValueError):
+        list(decompress([b''], codec='unknown'))
+
+
+@pytest.mark.parametrize('kind', KINDS)
+@pytest.mark.parametrize('chunk_bytes', [0, 100, 1024**2])
+def test_compress(kind, chunk_bytes):
+    """Data compressed in pieces comes back as it was."""
+    text = DATA.decode()
+    buffers = [text[i:i+100] for i in range(0, len(text), 100)]
+    compressed = b''.join(compress(buffers, kind, encoding='utf-8', chunk_bytes=chunk_bytes))
+    assert b''.join(decompress([compressed], kind)) == DATA
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_compress_codec(codec):
+    """Every available deflate codec writes standard gzip."""
+    compressed = b''.join(compress(split(DATA, 1000), codec=codec, level=9))
+    assert gzip.decompress(compressed) == DATA
+    assert b''.join(decompress([compressed], codec=codec)) == DATA
+
+
+def test_coalesce():
+    """Small buffers are joined up to `size`, larger ones pass through as is."""
+    buffers = [b'a', b'bb', b'ccc', b'dddddddddd', b'e']
+    assert list(_coalesce(buffers, 4)) == [b'abbccc', b'dddddddddd', b'e']
+    assert list(_coalesce([], 4)) == []
+
+
+def test_compress_many():
+    """Independent streams are each compressed in full."""
+    streams = {name: split(DATA, size) for name, size in (('a', 10), ('b', 1000), ('c', 10**6))}
+    streams['empty'] = []
+    compressed = compress_many(streams, workers=2, kind='bzip')
+    assert list(compressed) == list(streams)
+    for name, buffers in streams.items():
+        assert bz2.decompress(compressed[name]) == b''.join(buffers)
@@ -0,0 +1,45 @@
+# This file is part of the Dataphile package.
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the Apache License (v2.0) as published by the Apache Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the Apache License for more details.
+#
+# You should have received a copy of the Apache License along with this program.
+# If not, see <https://www.apache.org/licenses/LICENSE-2.0>.
+
+"""Tests for statistical distributions."""
+
+# external libs
+import numpy as np
+import pytest
+
+# internal libs
+from dataphile.statistics.distributions import polynomial1D
+
+
+def power_sum(x, *p):
+    """Polynomial as the sum of powers (as it was defined before Horner's method)."""
+    return sum(p_i * x**i for i, p_i in enumerate(p))
+
+
+@pytest.mark.parametrize('x, p, dtype', [
+    (np.arange(10), (1, -2, 3), np.int64),
+    (np.arange(10), (1.5, -2, 3), np.float64),
+    (np.linspace(0, 1, 10), (1, -2, 3), np.float64),
+    (np.linspace(0, 1, 10, dtype=np.float32), (100, -0.01, -1e-5), np.float32),
+])
+def test_polynomial1D_dtype(x, p, dtype):
+    """The result keeps the type of the inputs (integers are not promoted)."""
+    y = polynomial1D(x, *p)
+    assert y.dtype == dtype
+    assert y.dtype == power_sum(x, *p).dtype
+    assert np.allclose(y, power_sum(x, *p))
+
+
+def test_polynomial1D_scalar():
+    """Scalar in, scalar out."""
+    assert np.ndim(polynomial1D(2.0, 1, 2, 3)) == 0
+    assert polynomial1D(2, 1, 2, 3) == 17
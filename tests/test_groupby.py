@@ -0,0 +1,147 @@
+# This file is part of the Dataphile package.
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the Apache License (v2.0) as published by the Apache Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the Apache License for more details.
+#
+# You should have received a copy of the Apache License along with this program.
+# If not, see <https://www.apache.org/licenses/LICENSE-2.0>.
+
+"""Tests for the 'groupby' command."""
+
+# standard libs
+import os
+import gzip
+import bz2
+import lzma
+import sys
+import subprocess
+
+# external libs
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = 'import sys; from dataphile.bin.groupby import main; sys.exit(main())'
+
+
+def groupby(*args: str, cwd: str) -> subprocess.CompletedProcess:
+    """Run the command in a new interpreter (with a timeout in case it hangs)."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, '-c', MAIN, *args], cwd=cwd, env=env,
+                          capture_output=True, text=True, timeout=120)
+
+
+def write_csv(path: str, rows: int, keys: str='abcdefghijklmnopqrstuvwxyz') -> None:
+    """Write `rows` of (key, value) with a header."""
+    with open(path, mode='w') as output:
+        output.write('key,value\n')
+        for i in range(rows):
+            output.write(f'{keys[i % len(keys)]},{i}\n')
+
+
+@pytest.mark.parametrize('rows', [2000, 200000])
+def test_worker_failure(tmp_path, rows):
+    """A worker that cannot write its outputs fails the command (and it still exits)."""
+    write_csv(tmp_path / 'data.csv', rows)
+    result = groupby('-j', '2', '-H', '1', '-f', 'key', '-o', 'missing/%.csv', 'data.csv', cwd=tmp_path)
+    assert result.returncode == 1
+    assert 'FileNotFoundError' in result.stderr
+    assert not (tmp_path / 'missing').exists()
+
+
+def test_workers_match_serial(tmp_path):
+    """Outputs are the same written from worker processes."""
+    write_csv(tmp_path / 'data.csv', 50000)
+    for name, workers in ('serial', '1'), ('parallel', '3'):
+        (tmp_path / name).mkdir()
+        result = groupby('-j', workers, '-H', '1', '-f', 'key', '-T', name, 'data.csv', cwd=tmp_path)
+        assert result.returncode == 0, result.stderr
+    serial = sorted(os.listdir(tmp_path / 'serial'))
+    assert serial == sorted(os.listdir(tmp_path / 'parallel'))
+    for filename in serial:
+        assert (tmp_path / 'serial' / filename).read_bytes() == (tmp_path / 'parallel' / filename).read_bytes()
+
+
+@pytest.mark.parametrize('flag', ['--sum', '--mean', '--stdev'])
+def test_aggregate_not_supported(tmp_path, flag):
+    """The aggregate flags are still accepted by the parser but rejected with a clear error."""
+    write_csv(tmp_path / 'data.csv', 10)
+    result = groupby(flag, '-H', '1', 'data.csv', cwd=tmp_path)
+    assert result.returncode == 2
+    assert f'{flag} is not supported' in result.stderr
+    assert 'unrecognized arguments' not in result.stderr
+
+
+def test_short_row(tmp_path):
+    """A row without the field to group by is an error (with its line number), blank lines are skipped."""
+    (tmp_path / 'data.csv').write_text('key,value\na,1\n\nb,2\nc\n')
+    result = groupby('-H', '1', '-f', 'value', 'data.csv', cwd=tmp_path)
+    assert result.returncode == 1
+    assert 'line 5 has 1 field(s)' in result.stderr
+
+
+@pytest.mark.parametrize('args', [('-H', '1', '-f', '2'), ('-H', '1', '-f', '-3'), ('-f', '2')])
+def test_field_out_of_range(tmp_path, args):
+    """A field number past the width of the data is an error instead of empty output."""
+    (tmp_path / 'data.csv').write_text('key,value\na,1\nb,2\n')
+    result = groupby(*args, 'data.csv', cwd=tmp_path)
+    assert result.returncode == 1
+    assert 'no field "2"' in result.stderr or 'does not name an available field' in result.stderr
+    assert [path.name for path in tmp_path.iterdir()] == ['data.csv']  # nothing written
+
+
+def read_outputs(path) -> dict:
+    """Contents of every output file in `path` by name."""
+    return {name: (path / name).read_text() for name in sorted(os.listdir(path))}
+
+
+def test_quoted_fields(tmp_path):
+    """Quoted fields with delimiters or newlines are kept whole, even across buffers."""
+    rows = [f'{"ab"[i % 2]},"{i}, with ""quotes""\nand a newline {"x" * (i % 500)}"\n' for i in range(100)]
+    (tmp_path / 'data.csv').write_text('key,value\n' + ''.join(rows))
+    (tmp_path / 'out').mkdir()
+    result = groupby('-s', '0.001', '-H', '1', '-f', 'key', '-T', 'out', 'data.csv', cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+    outputs = read_outputs(tmp_path / 'out')
+    assert list(outputs) == ['a.csv', 'b.csv']
+    for name, output in outputs.items():
+        expected = [row[2:] for row in rows if row[0] == name[0]]
+        assert output == 'value\n' + ''.join(expected)
+
+
+def test_delimiter_and_replacements(tmp_path):
+    """Fields split on the given delimiter, slashes and colons in keys are replaced in filenames."""
+    (tmp_path / 'data.txt').write_text('1|a/b|x\n2|c:d|y\n3|a/b|z\n')
+    result = groupby('-d', '|', '-f', '1', '--slash', '_', '--colon', '+', '-o', '%.txt', 'data.txt',
+                     cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / 'a_b.txt').read_text() == '1,x\n3,z\n'
+    assert (tmp_path / 'c+d.txt').read_text() == '2,y\n'
+
+
+@pytest.mark.parametrize('suffix, reader', [('.gz', gzip.open), ('.bz2', bz2.open), ('.xz', lzma.open)])
+def test_compressed_outputs(tmp_path, suffix, reader):
+    """Output compression follows the file extension."""
+    write_csv(tmp_path / 'data.csv', 1000, keys='ab')
+    result = groupby('-H', '1', '-f', 'key', '-o', f'%.csv{suffix}', 'data.csv', cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+    with reader(tmp_path / f'a.csv{suffix}', mode='rt') as output:
+        assert output.read() == 'value\n' + ''.join(f'{i}\n' for i in range(0, 1000, 2))
+
+
+def test_many_groups(tmp_path):
+    """Files closed to stay under the limit are appended to later (header written once)."""
+    with open(tmp_path / 'data.csv', mode='w') as output:
+        output.write('value,key\n')
+        for i in range(120000):
+            output.write(f'{i},k{i % 600}\n')
+    (tmp_path / 'out').mkdir()
+    result = groupby('-H', '1', '-f', 'key', '-T', 'out', 'data.csv', cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+    outputs = read_outputs(tmp_path / 'out')
+    assert len(outputs) == 600
+    assert outputs['k7.csv'] == 'value\n' + ''.join(f'{i}\n' for i in range(7, 120000, 600))
@@ -0,0 +1,95 @@
+# This file is part of the Dataphile package.
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the Apache License (v2.0) as published by the Apache Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the Apache License for more details.
+#
+# You should have received a copy of the Apache License along with this program.
+# If not, see <https://www.apache.org/licenses/LICENSE-2.0>.
+
+"""Tests for HDF5 input/output."""
+
+# external libs
+import numpy as np
+import pandas as pd
+import pytest
+from h5py import File
+
+# internal libs
+from dataphile.io import hdf5
+
+
+DATASETS = {
+    'ints': np.arange(1000),
+    'floats': np.linspace(0, 1, 1000).reshape(10, 100),
+    'strings': np.array(['alpha', 'beta', 'gamma']),
+    'times': np.array(['2019-01-01T00:00:00', '2019-06-30T12:34:56.789'], dtype='datetime64[ns]'),
+}
+
+
+def check_datasets(data):
+    """Compare `data` read back against `DATASETS`."""
+    assert set(data) == set(DATASETS)
+    for name, array in DATASETS.items():
+        assert data[name].dtype == array.dtype
+        assert np.array_equal(data[name], array)
+
+
+def test_write_read(tmp_path):
+    """Datasets of all supported types come back as they were written."""
+    filename = str(tmp_path / 'data.h5')
+    hdf5.write(filename, '/group', **DATASETS)
+    check_datasets(hdf5.read(filename, '/group'))
+
+
+def test_write_compression(tmp_path):
+    """Datasets are chunked and gzip/shuffle compressed by default."""
+    filename = str(tmp_path / 'data.h5')
+    hdf5.write(filename, **DATASETS)
+    with File(filename, mode='r') as infile:
+        for name in DATASETS:
+            assert infile[name].chunks is not None
+            assert infile[name].compression == 'gzip'
+            assert infile[name].shuffle
+
+
+@pytest.mark.parametrize('compression', [None, 'lzf'])
+def test_write_compression_option(tmp_path, compression):
+    """Datasets are written contiguous with compression=None, or with another filter."""
+    filename = str(tmp_path / 'data.h5')
+    hdf5.write(filename, compression=compression, **DATASETS)
+    with File(filename, mode='r') as infile:
+        for name in DATASETS:
+            assert infile[name].compression == compression
+            assert (infile[name].chunks is None) == (compression is None)
+    check_datasets(hdf5.read(filename))
+
+
+def test_write_dataset_named_compression(tmp_path):
+    """An array cannot be passed as `compression` (it is not a dataset name)."""
+    with pytest.raises(TypeError):
+        hdf5.write(str(tmp_path / 'data.h5'), compression=np.arange(10))
+
+
+def test_write_table(tmp_path):
+    """A table with a 'compression' column (and string columns) round trips."""
+    filename = str(tmp_path / 'data.h5')
+    df = pd.DataFrame({'compression': np.arange(5, dtype=float),
+                       'name': ['a', 'bb', 'ccc', 'dddd', 'eeeee']})
+    hdf5.write_table(df, filename, '/table')
+    result = hdf5.read_table(filename, '/table')
+    assert list(result['compression']) == list(df['compression'])
+    assert list(result['name']) == list(df['name'])
+
+
+@pytest.mark.parametrize('missing', [None, np.nan])
+def test_write_missing_strings(tmp_path, missing):
+    """Missing values among strings are rejected (not stored as 'None' or 'nan')."""
+    filename = str(tmp_path / 'data.h5')
+    with pytest.raises(TypeError):
+        hdf5.write(filename, names=np.array(['a', missing, 'c'], dtype=object))
+    with pytest.raises(TypeError):
+        hdf5.write_table(pd.DataFrame({'name': ['a', missing, 'c']}), filename)
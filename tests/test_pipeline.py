@@ -0,0 +1,83 @@
+# This file is part of the Dataphile package.
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the Apache License (v2.0) as published by the Apache Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the Apache License for more details.
+#
+# You should have received a copy of the Apache License along with this program.
+# If not, see <https://www.apache.org/licenses/LICENSE-2.0>.
+
+"""Tests for background prefetching in data pipelines."""
+
+# standard libs
+import itertools
+import threading
+
+# external libs
+import pytest
+
+# internal libs
+from dataphile.io.pipeline import Prefetch, prefetch
+
+
+def failing(count):
+    """Yield `count` items and then fail."""
+    yield from range(count)
+    raise OSError('read failed')
+
+
+@pytest.mark.parametrize('depth', [1, 2, 10])
+def test_prefetch_order(depth):
+    """All items arrive in order, for any depth."""
+    assert list(Prefetch(range(1000), depth=depth)) == list(range(1000))
+    assert list(prefetch(range(1000), depth=depth)) == list(range(1000))
+
+
+def test_prefetch_empty():
+    """An empty iterable gives nothing."""
+    assert list(Prefetch([])) == []
+
+
+def test_prefetch_runs_ahead():
+    """The producer reads ahead of the consumer, on another thread."""
+    threads = []
+    def source():
+        for i in range(3):
+            threads.append(threading.current_thread())
+            yield i
+    assert list(Prefetch(source())) == [0, 1, 2]
+    assert threads and all(thread is not threading.current_thread() for thread in threads)
+
+
+def test_prefetch_error():
+    """An exception in the producer is re-raised to the consumer after the items before it."""
+    received = []
+    with pytest.raises(OSError, match='read failed'):
+        for item in Prefetch(failing(5)):
+            received.append(item)
+    assert received == list(range(5))
+
+
+def test_prefetch_close():
+    """Stopping early (or closing) stops the producer, even on an endless source."""
+    pipeline = Prefetch(itertools.count(), depth=2)
+    for item in pipeline:
+        if item == 10:
+            break
+    pipeline._thread.join(timeout=5)
+    assert not pipeline._thread.is_alive()
+
+    pipeline = Prefetch(itertools.count(), depth=2)
+    pipeline.close()
+    pipeline._thread.join(timeout=5)
+    assert not pipeline._thread.is_alive()
+
+
+@pytest.mark.parametrize('depth, error', [(0, ValueError), (-1, ValueError), (2.5, TypeError)])
+def test_prefetch_depth(depth, error):
+    """Depth has to be a positive integer."""
+    with pytest.raises(error):
+        Prefetch([], depth=depth)
@@ -0,0 +1,105 @@
+# This file is part of the Dataphile package.
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the Apache License (v2.0) as published by the Apache Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the Apache License for more details.
+#
+# You should have received a copy of the Apache License along with this program.
+# If not, see <https://www.apache.org/licenses/LICENSE-2.0>.
+
+"""Tests for function wrappers."""
+
+# standard libs
+import time
+import signal
+import threading
+
+# external libs
+import pytest
+
+# internal libs
+from dataphile.core.wrappers import timeout
+
+
+pytestmark = pytest.mark.skipif(not hasattr(signal, 'setitimer'), reason='needs SIGALRM')
+
+
+def sleep(seconds, result='done'):
+    """Sleep for `seconds` and return `result`."""
+    time.sleep(seconds)
+    return result
+
+
+def test_timeout_result():
+    """A call that finishes in time returns its own result."""
+    assert timeout(1, 'timeout')(sleep)(0, 'done') == 'done'
+    assert signal.getitimer(signal.ITIMER_REAL) == (0, 0)
+
+
+def test_timeout_action():
+    """A call that runs out of time returns (or calls) the action."""
+    assert timeout(0.05, 'timeout')(sleep)(5) == 'timeout'
+    assert timeout(0.05, lambda: 'called')(sleep)(5) == 'called'
+    assert timeout(0.05)(sleep)(5) is None
+    assert signal.getitimer(signal.ITIMER_REAL) == (0, 0)
+
+
+def test_timeout_not_swallowed():
+    """A bare `except Exception` within the call does not stop the timeout."""
+    @timeout(0.05, 'timeout')
+    def stubborn():
+        for _ in range(50):
+            try:
+                time.sleep(0.1)
+            except Exception:
+                pass
+        return 'done'
+    start = time.monotonic()
+    assert stubborn() == 'timeout'
+    assert time.monotonic() - start < 1
+
+
+def test_timeout_nested_inner():
+    """An inner timeout that fires first returns its action and the outer call carries on."""
+    @timeout(2, 'outer')
+    def outer():
+        return timeout(0.05, 'inner')(sleep)(5), sleep(0, 'after')
+    assert outer() == ('inner', 'after')
+    assert signal.getitimer(signal.ITIMER_REAL) == (0, 0)
+
+
+def test_timeout_nested_outer():
+    """An outer timeout that fires first is not stopped (or reset) by the inner call."""
+    @timeout(0.1, 'outer')
+    def outer():
+        return timeout(2, 'inner')(sleep)(5)
+    start = time.monotonic()
+    assert outer() == 'outer'
+    assert time.monotonic() - start < 1
+
+
+def test_timeout_nested_rearm():
+    """The outer timeout still fires after an inner call finished in time."""
+    @timeout(0.2, 'outer')
+    def outer():
+        timeout(1, 'inner')(sleep)(0.05)
+        return sleep(5)
+    start = time.monotonic()
+    assert outer() == 'outer'
+    assert time.monotonic() - start < 1
+    assert signal.getitimer(signal.ITIMER_REAL) == (0, 0)
+
+
+def test_timeout_thread():
+    """Off the main thread (no SIGALRM) the call goes to a thread pool instead."""
+    results = []
+    def target():
+        results.append(timeout(1, 'timeout')(sleep)(0, 'done'))
+        results.append(timeout(0.05, 'timeout')(sleep)(0.5))
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join(timeout=5)
+    assert results == ['done', 'timeout']